@@ -0,0 +1,97 @@
+"""
+Combined GIF encoder for the desktop application.
+
+Runs in a child process started by GifToolsApp._combine_frames_from_csv.
+A spawned child imports the module of its target, so this module only
+depends on the standard library and PIL. Started from run_gui.py, whose
+GUI import is under its main guard, the child loads neither tkinter nor
+the gif_tools processing modules before it starts encoding.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+
+def encode_combined_gif(output_path: str, frame_paths, durations, disposal_methods,
+                        loop_count: int, background: int, transparency: int,
+                        quality: int, progress_queue):
+    """
+    Decode frame files and write them out as one GIF.
+    
+    Runs in a separate process started by GifToolsApp._combine_frames_from_csv.
+    Progress is posted to progress_queue as ('progress', (percent, message))
+    and a failure as ('error', message).
+    """
+    def load_frame(path):
+        frame = Image.open(path)
+        frame.load()  # Decodes the frame and releases its file handle
+        return frame
+    
+    def iter_frames(paths):
+        """
+        Yield decoded frames in order for the encoder to pull.
+        
+        Frames are decoded on a thread pool (PIL releases the GIL while
+        decoding), at most `window` frames ahead of the encoder. Each
+        frame is fully loaded, so its file handle is released right away
+        instead of staying open until the GIF is written. This does not
+        bound memory: PIL's GIF writer collects every appended frame
+        before it writes them, so peak memory still grows with the
+        number of frames.
+        """
+        window = os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            pending = deque()
+            for path in paths:
+                pending.append(executor.submit(load_frame, path))
+                if len(pending) > window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    def report_progress(frames, total):
+        """Pass frames through, reporting progress about once per percent."""
+        step = max(1, total // 100)
+        for index, frame in enumerate(frames, start=1):
+            if index % step == 0 or index == total:
+                progress_queue.put(('progress', (index * 100 // total, f"Combining frames ({index}/{total})...")))
+            yield frame
+    
+    try:
+        frames = report_progress(iter_frames(frame_paths), len(frame_paths))
+        first_frame = next(frames)
+        
+        # Create GIF from frames with original timing
+        if len(frame_paths) == 1:
+            # Single frame
+            first_frame.save(
+                output_path,
+                format='GIF',
+                quality=quality,
+                disposal=disposal_methods[0] if disposal_methods else 2,
+                transparency=transparency,
+                background=background,
+                optimize=False
+            )
+        else:
+            # Multiple frames with original timing; the remaining frames
+            # are decoded in parallel as the writer pulls them (it still
+            # holds them all before writing)
+            first_frame.save(
+                output_path,
+                save_all=True,
+                append_images=frames,
+                duration=list(durations),
+                loop=loop_count,
+                disposal=disposal_methods[0] if disposal_methods else 2,
+                transparency=transparency,
+                background=background,
+                optimize=False
+            )
+        
+        first_frame.close()
+    except Exception as e:
+        progress_queue.put(('error', str(e)))
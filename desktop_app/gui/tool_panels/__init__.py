@@ -2,42 +2,53 @@
 Tool Panels Package
 
 Contains GUI panels for all GIF processing tools.
+
+Panel classes are resolved lazily on first attribute access so importing
+the package does not pull in every panel module (and its PIL / core
+dependencies) up front.
 """
 
-from .rearrange_panel import RearrangePanel
-from .video_to_gif_panel import VideoToGifPanel
-from .resize_panel import ResizePanel
-from .rotate_panel import RotatePanel
-from .crop_panel import CropPanel
-from .split_panel import SplitPanel
-from .merge_panel import MergePanel
-from .free_play_panel import FreePlayPanel
-from .reverse_panel import ReversePanel
-from .optimize_panel import OptimizePanel
-from .speed_control_panel import SpeedControlPanel
-from .filter_effects_panel import FilterEffectsPanel
-from .extract_frames_panel import ExtractFramesPanel
-from .combine_frames_panel import CombineFramesPanel
-from .loop_settings_panel import LoopSettingsPanel
-from .format_conversion_panel import FormatConversionPanel
-from .watermark_panel import WatermarkPanel
-
-__all__ = [
-    'RearrangePanel',
-    'VideoToGifPanel',
-    'ResizePanel',
-    'RotatePanel',
-    'CropPanel',
-    'SplitPanel',
-    'MergePanel',
-    'FreePlayPanel',
-    'ReversePanel',
-    'OptimizePanel',
-    'SpeedControlPanel',
-    'FilterEffectsPanel',
-    'ExtractFramesPanel',
-    'CombineFramesPanel',
-    'LoopSettingsPanel',
-    'FormatConversionPanel',
-    'WatermarkPanel',
-]
+import importlib
+
+# Maps each exported panel class to the submodule that defines it
+_lazy = {
+    'RearrangePanel': '.rearrange_panel',
+    'VideoToGifPanel': '.video_to_gif_panel',
+    'ResizePanel': '.resize_panel',
+    'RotatePanel': '.rotate_panel',
+    'CropPanel': '.crop_panel',
+    'SplitPanel': '.split_panel',
+    'MergePanel': '.merge_panel',
+    'FreePlayPanel': '.free_play_panel',
+    'ReversePanel': '.reverse_panel',
+    'OptimizePanel': '.optimize_panel',
+    'SpeedControlPanel': '.speed_control_panel',
+    'FilterEffectsPanel': '.filter_effects_panel',
+    'ExtractFramesPanel': '.extract_frames_panel',
+    'CombineFramesPanel': '.combine_frames_panel',
+    'LoopSettingsPanel': '.loop_settings_panel',
+    'FormatConversionPanel': '.format_conversion_panel',
+    'WatermarkPanel': '.watermark_panel',
+    'AddTextPanel': '.add_text_panel',
+}
+
+# Derived from the lazy map so the export list cannot drift from it
+__all__ = list(_lazy)
+
+
+def __getattr__(name):
+    """Import the panel module for ``name`` on first access."""
+    if name not in _lazy:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_lazy[name], __name__)
+    value = getattr(module, name)
+
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List exported panels alongside regular module attributes."""
+    return sorted(set(globals()) | set(__all__))
@@ -5,14 +5,73 @@ GUI panel for the GIF add text tool with interactive controls.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, font, colorchooser
+from tkinter import ttk, messagebox, colorchooser, font as tkfont
 from pathlib import Path
 from typing import Optional, Callable, Any
+import functools
+import queue
 import threading
-import math
+import time
 
 from PIL import Image, ImageDraw, ImageFont, ImageTk
-from gif_tools.core.add_text import add_text_to_gif
+
+# Shared grid options for the "label / control / value" rows
+_LABEL_GRID = {'sticky': tk.W, 'pady': 5}
+_CONTROL_GRID = {'sticky': tk.W, 'padx': (5, 0), 'pady': 5}
+
+_ALIGNMENTS = ("left", "center", "right")
+
+# Delay used to coalesce bursts of preview updates (milliseconds)
+_PREVIEW_DEBOUNCE_MS = 40
+
+# Font families offered in the font dropdown
+_FONT_FAMILIES = (
+    "Arial", "Times New Roman", "Courier New", "Helvetica", "Verdana",
+    "Tahoma", "Calibri", "Segoe UI", "Arabic Typesetting", "Arial Unicode MS",
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_font(font_family: str, font_size: int):
+    """
+    Load a font for the preview, falling back to PIL's default font.
+    
+    Results are cached so preview redraws do not re-parse the font file.
+    """
+    try:
+        return ImageFont.truetype(font_family, font_size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=256)
+def _text_bbox(font_family: str, font_size: int, text: str):
+    """
+    Measure text at the origin, as ImageDraw.textbbox((0, 0), ...) would.
+    
+    Cached per (font, size, text) so moving the text around the preview
+    does not shape it through FreeType again. Callers offset the box by
+    their own position.
+    """
+    return _load_font(font_family, font_size).getbbox(text)
+
+
+@functools.lru_cache(maxsize=1)
+def _available_font_families() -> tuple:
+    """
+    Return the entries of _FONT_FAMILIES installed on this system.
+    
+    Needs a Tk root, so it is resolved on first use rather than at import,
+    and only once per process. Falls back to the full list if none match.
+    """
+    installed = set(tkfont.families())
+    available = tuple(family for family in _FONT_FAMILIES if family in installed)
+    return available or _FONT_FAMILIES
+
+
+def _is_digits(value: str) -> bool:
+    """Entry validator allowing only an empty string or decimal digits."""
+    return value == "" or value.isdecimal()
 
 
 class AddTextPanel:
@@ -30,17 +89,72 @@ class AddTextPanel:
         self.on_process = on_process
         self.current_file = None
         self.preview_gif = None
-        self.preview_frames = []
+        self.preview_frames = []  # RGBA frames
         self.current_frame = 0
+        
+        # Preview canvas size, tracked from <Configure> events, and the
+        # persistent Tk image / canvas item the preview is drawn into
+        self._canvas_size = (1, 1)
+        self._photo = None
+        self._canvas_item = None
+        
+        # Bumped on every GIF load so stale renders and caches are discarded
+        self._preview_generation = 0
+        
+        # Frames resized to fit the canvas, rebuilt when the canvas resizes.
+        # Owned by the render worker.
+        self.display_scale = None
+        self._display_size = None
+        self._display_cache_key = None
+        self._display_frames = []
         self.is_playing = False
-        self.play_thread = None
-        self.setup_ui()
+        
+        # Playback is driven by Tk after() calls against a monotonic deadline
+        self._play_after_id = None
+        self._next_frame_time = 0.0
+        
+        # Last rendered text layer and the settings it was rendered with.
+        # Owned by the render worker.
+        self._text_layer_key = None
+        self._text_layer = None
+        self._text_layer_placement = None
+        
+        # Pending debounced preview redraw (Tk after id) and the inputs of
+        # the frame currently shown
+        self._pending_preview = None
+        self._last_render_key = None
+        
+        # Preview rendering runs on a worker thread fed by a one-slot queue
+        self._render_queue = queue.Queue(maxsize=1)
+        self._render_thread = None
+        
+        # Newest rendered (render_key, frame, geometry) waiting to be shown,
+        # and whether a Tk callback to show it is already scheduled. Frames
+        # the Tk thread does not get to in time are replaced, not queued.
+        self._display_lock = threading.Lock()
+        self._latest_render = None
+        self._pending_display = False
+        
+        # (display_scale, display size) of the frame on screen; the Tk
+        # thread's copy, used to map canvas clicks to GIF coordinates
+        self._shown_geometry = None
+        
+        # Widgets are built on first use (see get_widget)
+        self.main_container = None
+        self._built = False
+    
+    def _ensure_built(self):
+        """Build the panel UI if it has not been built yet."""
+        if not self._built:
+            self.setup_ui()
+            self._built = True
     
     def setup_ui(self):
         """Create the add text panel UI with live preview."""
         # Main container
         self.main_container = ttk.Frame(self.parent)
         self.main_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.main_container.bind('<Destroy>', self._on_destroy)
         
         # Left panel - Controls
         self.controls_frame = ttk.LabelFrame(self.main_container, text="Text Settings", padding="10")
@@ -53,12 +167,46 @@ class AddTextPanel:
         self.setup_controls()
         self.setup_preview()
     
+    def _grid_row(self, row, label_text, widget, value_text=None):
+        """
+        Grid a "label / control / value label" row in the controls panel.
+        
+        Args:
+            row: Grid row to place the widgets in
+            label_text: Text for the leading label, or None to skip it
+            widget: Control placed in column 1
+            value_text: Initial text of a trailing value label, or None
+            
+        Returns:
+            The trailing value label, or None if value_text was not given
+        """
+        if label_text is not None:
+            ttk.Label(self.controls_frame, text=label_text).grid(row=row, column=0, **_LABEL_GRID)
+        widget.grid(row=row, column=1, **_CONTROL_GRID)
+        if value_text is None:
+            return None
+        value_label = ttk.Label(self.controls_frame, text=value_text)
+        value_label.grid(row=row, column=2, **_CONTROL_GRID)
+        return value_label
+    
+    def _make_scale(self, from_, to, variable, command=None):
+        """Create a horizontal scale in the controls panel."""
+        return ttk.Scale(
+            self.controls_frame, 
+            from_=from_, 
+            to=to, 
+            variable=variable,
+            orient=tk.HORIZONTAL,
+            length=150,
+            command=command
+        )
+    
     def setup_controls(self):
         """Setup the controls panel."""
         row = 0
         
         # Text input
-        ttk.Label(self.controls_frame, text="Text:").grid(row=row, column=0, sticky=tk.W, pady=5)
+        ttk.Label(self.controls_frame, text="Text:").grid(row=row, column=0, **_LABEL_GRID)
         self.text_var = tk.StringVar(value="Hello World!")
         self.text_var.trace('w', self.update_preview)
         text_entry = ttk.Entry(self.controls_frame, textvariable=self.text_var, width=25)
@@ -66,93 +214,72 @@ class AddTextPanel:
         row += 1
         
         # Click to position
-        ttk.Label(self.controls_frame, text="Position:").grid(row=row, column=0, sticky=tk.W, pady=5)
+        ttk.Label(self.controls_frame, text="Position:").grid(row=row, column=0, **_LABEL_GRID)
         self.click_pos_var = tk.StringVar(value="Click on preview to position")
         self.click_pos_label = ttk.Label(self.controls_frame, textvariable=self.click_pos_var, 
                                        foreground="blue", cursor="hand2")
-        self.click_pos_label.grid(row=row, column=1, columnspan=2, sticky=tk.W, pady=5)
+        self.click_pos_label.grid(row=row, column=1, columnspan=2, **_LABEL_GRID)
         self.click_pos_label.bind("<Button-1>", self.on_click_position)
         row += 1
         
         # Font controls
-        ttk.Label(self.controls_frame, text="Font:").grid(row=row, column=0, sticky=tk.W, pady=5)
-        self.font_family_var = tk.StringVar(value="Arial")
+        font_families = _available_font_families()
+        default_family = "Arial" if "Arial" in font_families else font_families[0]
+        self.font_family_var = tk.StringVar(value=default_family)
         self.font_family_var.trace('w', self.update_preview)
         font_combo = ttk.Combobox(
             self.controls_frame, 
             textvariable=self.font_family_var,
-            values=["Arial", "Times New Roman", "Courier New", "Helvetica", "Verdana", 
-                   "Tahoma", "Calibri", "Segoe UI", "Arabic Typesetting", "Arial Unicode MS"],
+            values=font_families,
             state="readonly",
             width=20
         )
-        font_combo.grid(row=row, column=1, sticky=tk.W, padx=(5, 0), pady=5)
+        self._grid_row(row, "Font:", font_combo)
         font_combo.bind('<<ComboboxSelected>>', self.on_font_change)
         font_combo.bind('<FocusOut>', self.on_font_change)
         row += 1
         
         # Font size
-        ttk.Label(self.controls_frame, text="Size:").grid(row=row, column=0, sticky=tk.W, pady=5)
         self.font_size_var = tk.IntVar(value=24)
         self.font_size_var.trace('w', self.update_preview)
-        size_scale = ttk.Scale(
-            self.controls_frame, 
-            from_=8, 
-            to=72, 
-            variable=self.font_size_var,
-            orient=tk.HORIZONTAL,
-            length=150,
-            command=self.on_font_size_change
-        )
-        size_scale.grid(row=row, column=1, sticky=tk.W, padx=(5, 0), pady=5)
-        self.size_label = ttk.Label(self.controls_frame, text="24")
-        self.size_label.grid(row=row, column=2, sticky=tk.W, padx=(5, 0), pady=5)
-        size_scale.bind('<ButtonRelease-1>', lambda e: self.update_preview())
+        size_scale = self._make_scale(8, 72, self.font_size_var, command=self.on_font_size_change)
+        self.size_label = self._grid_row(row, "Size:", size_scale, "24")
+        size_scale.bind('<ButtonRelease-1>', self.update_preview)
         row += 1
         
         # Text color with picker
-        ttk.Label(self.controls_frame, text="Text Color:").grid(row=row, column=0, sticky=tk.W, pady=5)
         self.text_color = (255, 255, 255)  # White
+        self._text_color_hex = "#ffffff"
         self.text_color_button = ttk.Button(
             self.controls_frame, 
             text="Choose Color", 
             command=self.choose_text_color
         )
-        self.text_color_button.grid(row=row, column=1, sticky=tk.W, padx=(5, 0), pady=5)
-        self.text_color_preview = tk.Frame(self.controls_frame, width=30, height=20, bg="white")
-        self.text_color_preview.grid(row=row, column=2, sticky=tk.W, padx=(5, 0), pady=5)
+        self._grid_row(row, "Text Color:", self.text_color_button)
+        self.text_color_preview = tk.Frame(self.controls_frame, width=30, height=20, bg=self._text_color_hex)
+        self.text_color_preview.grid(row=row, column=2, **_CONTROL_GRID)
         row += 1
         
         # Text opacity
-        ttk.Label(self.controls_frame, text="Text Opacity:").grid(row=row, column=0, sticky=tk.W, pady=5)
         self.text_opacity_var = tk.DoubleVar(value=1.0)
         self.text_opacity_var.trace('w', self.update_preview)
-        text_opacity_scale = ttk.Scale(
-            self.controls_frame, 
-            from_=0.0, 
-            to=1.0, 
-            variable=self.text_opacity_var,
-            orient=tk.HORIZONTAL,
-            length=150
-        )
-        text_opacity_scale.grid(row=row, column=1, sticky=tk.W, padx=(5, 0), pady=5)
-        self.text_opacity_label = ttk.Label(self.controls_frame, text="100%")
-        self.text_opacity_label.grid(row=row, column=2, sticky=tk.W, padx=(5, 0), pady=5)
-        text_opacity_scale.configure(command=self.update_text_opacity_label)
+        self.text_opacity_var.trace('w', self._update_rgba_colors)
+        text_opacity_scale = self._make_scale(0.0, 1.0, self.text_opacity_var,
+                                              command=self.update_text_opacity_label)
+        self.text_opacity_label = self._grid_row(row, "Text Opacity:", text_opacity_scale, "100%")
         row += 1
         
         # Alignment
-        ttk.Label(self.controls_frame, text="Alignment:").grid(row=row, column=0, sticky=tk.W, pady=5)
         self.alignment_var = tk.StringVar(value="center")
         self.alignment_var.trace('w', self.update_preview)
         align_combo = ttk.Combobox(
             self.controls_frame, 
             textvariable=self.alignment_var,
-            values=["left", "center", "right"],
+            values=_ALIGNMENTS,
             state="readonly",
             width=15
         )
-        align_combo.grid(row=row, column=1, sticky=tk.W, padx=(5, 0), pady=5)
+        self._grid_row(row, "Alignment:", align_combo)
         row += 1
         
         # Background controls
@@ -164,39 +291,31 @@ class AddTextPanel:
             variable=self.bg_enabled_var,
             command=self.toggle_background
         )
-        bg_check.grid(row=row, column=0, columnspan=2, sticky=tk.W, pady=5)
+        bg_check.grid(row=row, column=0, columnspan=2, **_LABEL_GRID)
         row += 1
         
         # Background color
         self.bg_color = (0, 0, 0)  # Black
+        self._bg_color_hex = "#000000"
         self.bg_color_button = ttk.Button(
             self.controls_frame, 
             text="BG Color", 
             command=self.choose_bg_color,
             state=tk.DISABLED
         )
-        self.bg_color_button.grid(row=row, column=1, sticky=tk.W, padx=(5, 0), pady=5)
-        self.bg_color_preview = tk.Frame(self.controls_frame, width=30, height=20, bg="black")
-        self.bg_color_preview.grid(row=row, column=2, sticky=tk.W, padx=(5, 0), pady=5)
+        self._grid_row(row, None, self.bg_color_button)
+        self.bg_color_preview = tk.Frame(self.controls_frame, width=30, height=20, bg=self._bg_color_hex)
+        self.bg_color_preview.grid(row=row, column=2, **_CONTROL_GRID)
         row += 1
         
         # Background opacity
-        ttk.Label(self.controls_frame, text="BG Opacity:").grid(row=row, column=0, sticky=tk.W, pady=5)
         self.bg_opacity_var = tk.DoubleVar(value=0.5)
         self.bg_opacity_var.trace('w', self.update_preview)
-        self.bg_opacity_scale = ttk.Scale(
-            self.controls_frame, 
-            from_=0.0, 
-            to=1.0, 
-            variable=self.bg_opacity_var,
-            orient=tk.HORIZONTAL,
-            length=150
-        )
-        self.bg_opacity_scale.grid(row=row, column=1, sticky=tk.W, padx=(5, 0), pady=5)
+        self.bg_opacity_var.trace('w', self._update_rgba_colors)
+        self.bg_opacity_scale = self._make_scale(0.0, 1.0, self.bg_opacity_var,
+                                                 command=self.update_bg_opacity_label)
         self.bg_opacity_scale.config(state=tk.DISABLED)
-        self.bg_opacity_label = ttk.Label(self.controls_frame, text="50%")
-        self.bg_opacity_label.grid(row=row, column=2, sticky=tk.W, padx=(5, 0), pady=5)
-        self.bg_opacity_scale.configure(command=self.update_bg_opacity_label)
+        self.bg_opacity_label = self._grid_row(row, "BG Opacity:", self.bg_opacity_scale, "50%")
         row += 1
         
         # Stroke controls
@@ -208,76 +327,49 @@ class AddTextPanel:
             variable=self.stroke_enabled_var,
             command=self.toggle_stroke
         )
-        stroke_check.grid(row=row, column=0, columnspan=2, sticky=tk.W, pady=5)
+        stroke_check.grid(row=row, column=0, columnspan=2, **_LABEL_GRID)
         row += 1
         
         # Stroke width
-        ttk.Label(self.controls_frame, text="Stroke Width:").grid(row=row, column=0, sticky=tk.W, pady=5)
         self.stroke_width_var = tk.IntVar(value=2)
         self.stroke_width_var.trace('w', self.update_preview)
-        self.stroke_width_scale = ttk.Scale(
-            self.controls_frame, 
-            from_=0, 
-            to=10, 
-            variable=self.stroke_width_var,
-            orient=tk.HORIZONTAL,
-            length=150
-        )
-        self.stroke_width_scale.grid(row=row, column=1, sticky=tk.W, padx=(5, 0), pady=5)
+        self.stroke_width_scale = self._make_scale(0, 10, self.stroke_width_var,
+                                                   command=self.update_stroke_width_label)
         self.stroke_width_scale.config(state=tk.DISABLED)
-        self.stroke_width_label = ttk.Label(self.controls_frame, text="2")
-        self.stroke_width_label.grid(row=row, column=2, sticky=tk.W, padx=(5, 0), pady=5)
-        self.stroke_width_scale.configure(command=self.update_stroke_width_label)
+        self.stroke_width_label = self._grid_row(row, "Stroke Width:", self.stroke_width_scale, "2")
         row += 1
         
         # Stroke color
-        ttk.Label(self.controls_frame, text="Stroke Color:").grid(row=row, column=0, sticky=tk.W, pady=5)
         self.stroke_color = (0, 0, 0)  # Black
+        self._stroke_color_hex = "#000000"
         self.stroke_color_button = ttk.Button(
             self.controls_frame, 
             text="Stroke Color", 
             command=self.choose_stroke_color,
             state=tk.DISABLED
         )
-        self.stroke_color_button.grid(row=row, column=1, sticky=tk.W, padx=(5, 0), pady=5)
-        self.stroke_color_preview = tk.Frame(self.controls_frame, width=30, height=20, bg="black")
-        self.stroke_color_preview.grid(row=row, column=2, sticky=tk.W, padx=(5, 0), pady=5)
+        self._grid_row(row, "Stroke Color:", self.stroke_color_button)
+        self.stroke_color_preview = tk.Frame(self.controls_frame, width=30, height=20, bg=self._stroke_color_hex)
+        self.stroke_color_preview.grid(row=row, column=2, **_CONTROL_GRID)
         row += 1
         
         # Stroke opacity
-        ttk.Label(self.controls_frame, text="Stroke Opacity:").grid(row=row, column=0, sticky=tk.W, pady=5)
         self.stroke_opacity_var = tk.DoubleVar(value=1.0)
         self.stroke_opacity_var.trace('w', self.update_preview)
-        self.stroke_opacity_scale = ttk.Scale(
-            self.controls_frame, 
-            from_=0.0, 
-            to=1.0, 
-            variable=self.stroke_opacity_var,
-            orient=tk.HORIZONTAL,
-            length=150
-        )
-        self.stroke_opacity_scale.grid(row=row, column=1, sticky=tk.W, padx=(5, 0), pady=5)
+        self.stroke_opacity_var.trace('w', self._update_rgba_colors)
+        self.stroke_opacity_scale = self._make_scale(0.0, 1.0, self.stroke_opacity_var,
+                                                     command=self.update_stroke_opacity_label)
         self.stroke_opacity_scale.config(state=tk.DISABLED)
-        self.stroke_opacity_label = ttk.Label(self.controls_frame, text="100%")
-        self.stroke_opacity_label.grid(row=row, column=2, sticky=tk.W, padx=(5, 0), pady=5)
-        self.stroke_opacity_scale.configure(command=self.update_stroke_opacity_label)
+        self.stroke_opacity_label = self._grid_row(row, "Stroke Opacity:", self.stroke_opacity_scale, "100%")
         row += 1
         
+        # Fill colors with opacity applied, kept in sync by the traces above
+        self._update_rgba_colors()
+        
         # Quality control
-        ttk.Label(self.controls_frame, text="Quality:").grid(row=row, column=0, sticky=tk.W, pady=5)
         self.quality_var = tk.IntVar(value=85)
-        quality_scale = ttk.Scale(
-            self.controls_frame, 
-            from_=1, 
-            to=100, 
-            variable=self.quality_var,
-            orient=tk.HORIZONTAL,
-            length=150
-        )
-        quality_scale.grid(row=row, column=1, sticky=tk.W, padx=(5, 0), pady=5)
-        self.quality_label = ttk.Label(self.controls_frame, text="85")
-        self.quality_label.grid(row=row, column=2, sticky=tk.W, padx=(5, 0), pady=5)
-        quality_scale.configure(command=self.update_quality_label)
+        quality_scale = self._make_scale(1, 100, self.quality_var, command=self.update_quality_label)
+        self.quality_label = self._grid_row(row, "Quality:", quality_scale, "85")
         row += 1
         
         # Process button
@@ -307,6 +399,7 @@ class AddTextPanel:
         self.preview_canvas = tk.Canvas(self.preview_frame, width=600, height=500, bg="black")
         self.preview_canvas.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         self.preview_canvas.bind("<Button-1>", self.on_canvas_click)
+        self.preview_canvas.bind("<Configure>", self._on_canvas_resize)
         
         # Media player controls
         controls_frame = ttk.Frame(self.preview_frame)
@@ -319,7 +412,9 @@ class AddTextPanel:
         # Frame navigation
         ttk.Label(controls_frame, text="Frame:").pack(side=tk.LEFT, padx=(10, 5))
         self.frame_var = tk.StringVar(value="0")
-        self.frame_entry = ttk.Entry(controls_frame, textvariable=self.frame_var, width=8)
+        self.frame_entry = ttk.Entry(controls_frame, textvariable=self.frame_var, width=8,
+                                     validate='key',
+                                     validatecommand=(controls_frame.register(_is_digits), '%P'))
         self.frame_entry.pack(side=tk.LEFT, padx=(0, 5))
         self.frame_entry.bind("<Return>", self.on_frame_change)
         
@@ -345,29 +440,37 @@ class AddTextPanel:
             return
         
         # Calculate position relative to GIF
-        canvas_width = self.preview_canvas.winfo_width()
-        canvas_height = self.preview_canvas.winfo_height()
+        canvas_width, canvas_height = self._canvas_size
         
         if canvas_width <= 1 or canvas_height <= 1:
             return
         
-        # Get GIF dimensions
-        gif_width = self.preview_gif.width
-        gif_height = self.preview_gif.height
+        # Map through the geometry of the frame on screen; the worker's
+        # display_scale may already belong to a newer render
+        if self._shown_geometry is None:
+            return
+        display_scale, (display_width, display_height) = self._shown_geometry
         
-        # Calculate scale
-        scale_x = gif_width / canvas_width
-        scale_y = gif_height / canvas_height
+        # The displayed frame is centered on the canvas
+        left = canvas_width // 2 - display_width // 2
+        top = canvas_height // 2 - display_height // 2
         
-        # Convert click position to GIF coordinates
-        x = int(event.x * scale_x)
-        y = int(event.y * scale_y)
+        # Convert click position to GIF coordinates, clamped to the frame
+        x = int((event.x - left) / display_scale)
+        y = int((event.y - top) / display_scale)
+        x = min(max(x, 0), self.preview_gif.width - 1)
+        y = min(max(y, 0), self.preview_gif.height - 1)
         
         # Update position
         self.text_position = (x, y)
         self.click_pos_var.set(f"Position: ({x}, {y})")
         self.update_preview()
     
+    def _on_canvas_resize(self, event):
+        """Remember the new canvas size and redraw the preview to fit it."""
+        self._canvas_size = (event.width, event.height)
+        self.update_preview()
+    
     def on_click_position(self, event):
         """Handle click on position label."""
         self.click_pos_var.set("Click on preview to position")
@@ -378,37 +481,50 @@ class AddTextPanel:
     
     def on_font_size_change(self, value):
         """Handle font size change."""
-        self.size_label.config(text=str(int(float(value))))
+        self.size_label.config(text=str(self.font_size_var.get()))
         self.update_preview()
     
+    def _ask_color(self, title, current_hex):
+        """
+        Open the color picker.
+        
+        Args:
+            title: Dialog title
+            current_hex: Currently selected color as a Tk "#rrggbb" string
+            
+        Returns:
+            Tuple of ((r, g, b), "#rrggbb"), or None if the dialog was cancelled
+        """
+        rgb, hex_color = colorchooser.askcolor(title=title, color=current_hex)
+        if not hex_color:
+            return None
+        return tuple(int(c) for c in rgb), hex_color
+    
     def choose_text_color(self):
         """Open color picker for text color."""
-        color = colorchooser.askcolor(title="Choose Text Color", color=self.text_color)[1]
-        if color:
-            # Convert hex color to RGB tuple
-            hex_color = color.lstrip('#')
-            self.text_color = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            self.text_color_preview.config(bg=color)
+        picked = self._ask_color("Choose Text Color", self._text_color_hex)
+        if picked:
+            self.text_color, self._text_color_hex = picked
+            self.text_color_preview.config(bg=self._text_color_hex)
+            self._update_rgba_colors()
             self.update_preview()
     
     def choose_bg_color(self):
         """Open color picker for background color."""
-        color = colorchooser.askcolor(title="Choose Background Color", color=self.bg_color)[1]
-        if color:
-            # Convert hex color to RGB tuple
-            hex_color = color.lstrip('#')
-            self.bg_color = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            self.bg_color_preview.config(bg=color)
+        picked = self._ask_color("Choose Background Color", self._bg_color_hex)
+        if picked:
+            self.bg_color, self._bg_color_hex = picked
+            self.bg_color_preview.config(bg=self._bg_color_hex)
+            self._update_rgba_colors()
             self.update_preview()
     
     def choose_stroke_color(self):
         """Open color picker for stroke color."""
-        color = colorchooser.askcolor(title="Choose Stroke Color", color=self.stroke_color)[1]
-        if color:
-            # Convert hex color to RGB tuple
-            hex_color = color.lstrip('#')
-            self.stroke_color = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            self.stroke_color_preview.config(bg=color)
+        picked = self._ask_color("Choose Stroke Color", self._stroke_color_hex)
+        if picked:
+            self.stroke_color, self._stroke_color_hex = picked
+            self.stroke_color_preview.config(bg=self._stroke_color_hex)
+            self._update_rgba_colors()
             self.update_preview()
     
     def toggle_background(self):
@@ -435,7 +551,7 @@ class AddTextPanel:
     
     def update_size_label(self, value):
         """Update the size label when scale changes."""
-        self.size_label.config(text=str(int(float(value))))
+        self.size_label.config(text=str(self.font_size_var.get()))
     
     def update_text_opacity_label(self, value):
         """Update the text opacity label when scale changes."""
@@ -449,7 +565,7 @@ class AddTextPanel:
     
     def update_stroke_width_label(self, value):
         """Update the stroke width label when scale changes."""
-        self.stroke_width_label.config(text=str(int(float(value))))
+        self.stroke_width_label.config(text=str(self.stroke_width_var.get()))
     
     def update_stroke_opacity_label(self, value):
         """Update the stroke opacity label when scale changes."""
@@ -458,140 +574,367 @@ class AddTextPanel:
     
     def update_quality_label(self, value):
         """Update the quality label when scale changes."""
-        self.quality_label.config(text=str(int(float(value))))
+        self.quality_label.config(text=str(self.quality_var.get()))
     
     def update_preview(self, *args):
+        """
+        Schedule a live preview update.
+        
+        Calls arriving within _PREVIEW_DEBOUNCE_MS of each other (e.g. while
+        dragging a slider) are coalesced into a single redraw.
+        """
+        if self._pending_preview is not None:
+            self.parent.after_cancel(self._pending_preview)
+        self._pending_preview = self.parent.after(_PREVIEW_DEBOUNCE_MS, self._do_update_preview)
+    
+    def _do_update_preview(self):
         """Update the live preview."""
+        self._pending_preview = None
         if not self.preview_gif or not hasattr(self, 'text_position'):
             return
         
         try:
-            # Create preview frame with text
-            preview_frame = self.create_text_preview()
-            if preview_frame:
-                self.display_preview_frame(preview_frame)
+            # Skip the redraw when nothing that affects the shown frame changed
+            render_key = self._render_key()
+            if render_key != self._last_render_key:
+                self.request_render(render_key)
         except Exception as e:
             print(f"Preview update error: {e}")
     
-    def create_text_preview(self):
-        """Create a preview frame with text overlay."""
-        if not self.preview_gif or not hasattr(self, 'text_position'):
-            return None
+    def _render_key(self):
+        """
+        Get a snapshot of everything the rendered preview depends on.
         
+        Taken on the Tk thread so the render worker never reads Tk variables.
+        """
+        return (
+            self._preview_generation,
+            self.current_frame,
+            self._canvas_size,
+            self._text_settings()
+        )
+    
+    def _text_settings(self):
+        """Get a snapshot of every setting that affects the rendered text."""
+        return (
+            self.text_var.get(),
+            self.text_position,
+            self.font_family_var.get(),
+            self.font_size_var.get(),
+            self.alignment_var.get(),
+            self._text_rgba,
+            self.bg_enabled_var.get(),
+            self._bg_rgba,
+            self.stroke_enabled_var.get(),
+            self.stroke_width_var.get(),
+            self._stroke_rgba,
+        )
+    
+    def _update_rgba_colors(self, *args):
+        """Recompute the RGBA fill colors after a color or opacity change."""
+        self._text_rgba = self.text_color + (int(self.text_opacity_var.get() * 255),)
+        self._bg_rgba = self.bg_color + (int(self.bg_opacity_var.get() * 255),)
+        self._stroke_rgba = self.stroke_color + (int(self.stroke_opacity_var.get() * 255),)
+    
+    def request_render(self, render_key):
+        """
+        Hand a preview render to the render worker.
+        
+        The queue holds a single job, so a job the worker has not started yet
+        is replaced by the newer one.
+        
+        Args:
+            render_key: Snapshot from _render_key()
+        """
+        if self._render_thread is None:
+            self._render_thread = threading.Thread(target=self._render_worker, daemon=True)
+            self._render_thread.start()
+        self._replace_render_job((render_key, self.preview_frames))
+    
+    def _replace_render_job(self, job):
+        """Put a job on the render queue, dropping any job still waiting."""
         try:
-            # Get current frame
-            if self.preview_gif.is_animated:
-                frame = self.preview_frames[self.current_frame]
-            else:
-                frame = self.preview_gif
-            
-            # Create a copy for preview
-            preview = frame.copy().convert('RGBA')
-            draw = ImageDraw.Draw(preview)
+            self._render_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._render_queue.put_nowait(job)
+    
+    def _render_worker(self):
+        """Render previews off the Tk thread and hand the results back to it."""
+        while True:
+            job = self._render_queue.get()
+            if job is None:
+                break
             
-            # Get text settings
-            text = self.text_var.get()
-            if not text:
-                return preview
+            render_key, frames = job
+            frame = self.create_text_preview(render_key, frames)
+            if frame is None:
+                continue
             
-            position = self.text_position
-            font_family = self.font_family_var.get()
-            font_size = self.font_size_var.get()
-            alignment = self.alignment_var.get()
+            # Publish the frame with the geometry it was rendered at; at most
+            # one display callback is queued on Tk at a time, and it shows
+            # whatever frame is newest when it runs
+            geometry = (self.display_scale, self._display_size)
+            with self._display_lock:
+                self._latest_render = (render_key, frame, geometry)
+                if self._pending_display:
+                    continue
+                self._pending_display = True
             
-            # Create font
             try:
-                font_obj = ImageFont.truetype(font_family, font_size)
-            except:
-                font_obj = ImageFont.load_default()
-            
-            # Calculate text bounds for alignment
-            bbox = draw.textbbox((0, 0), text, font=font_obj)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            
-            # Adjust position based on alignment
-            if alignment == 'center':
-                position = (position[0] - text_width // 2, position[1])
-            elif alignment == 'right':
-                position = (position[0] - text_width, position[1])
+                self.parent.after(0, self._flush_pending_display)
+            except (RuntimeError, tk.TclError):
+                # The panel was destroyed while rendering
+                break
+    
+    def _flush_pending_display(self):
+        """Show the newest frame from the render worker (runs on the Tk thread)."""
+        with self._display_lock:
+            latest = self._latest_render
+            self._latest_render = None
+            self._pending_display = False
+        
+        if latest is None:
+            return
+        
+        render_key, frame, geometry = latest
+        if render_key[0] != self._preview_generation:
+            # Rendered from a GIF that has since been replaced
+            return
+        self.display_preview_frame(frame)
+        self._last_render_key = render_key
+        self._shown_geometry = geometry
+    
+    def _on_destroy(self, event):
+        """Stop playback and the render worker when the panel is destroyed."""
+        if event.widget is not self.main_container:
+            return
+        self.is_playing = False
+        if self._render_thread is not None:
+            self._replace_render_job(None)
+    
+    def create_text_preview(self, render_key, frames):
+        """
+        Create a preview frame with text overlay.
+        
+        Runs on the render worker; everything it needs comes from its arguments.
+        
+        Args:
+            render_key: Snapshot from _render_key()
+            frames: RGBA frames of the GIF the snapshot refers to
             
-            # Get colors with proper opacity
-            text_opacity = int(self.text_opacity_var.get() * 255)
-            text_color = self.text_color + (text_opacity,)
+        Returns:
+            Display-sized RGBA image, or None if nothing can be rendered
+        """
+        generation, index, canvas_size, settings = render_key
+        
+        try:
+            # Get current frame, already resized to fit the canvas
+            frame = self.get_display_frame(frames, generation, index, canvas_size)
+            if frame is None:
+                return None
             
-            # Draw background if enabled
-            if self.bg_enabled_var.get():
-                bg_opacity = int(self.bg_opacity_var.get() * 255)
-                bg_color = self.bg_color + (bg_opacity,)
-                
-                # Calculate background bounds
-                padding = 5
-                bg_bbox = (
-                    position[0] - padding,
-                    position[1] - padding,
-                    position[0] + text_width + padding,
-                    position[1] + text_height + padding
-                )
-                draw.rectangle(bg_bbox, fill=bg_color)
+            # Get text settings
+            (text, position, font_family, font_size, alignment, text_rgba,
+             bg_enabled, _, stroke_enabled, _, _) = settings
+            if not text:
+                return frame
             
-            # Draw stroke if enabled
-            if self.stroke_enabled_var.get():
-                stroke_width = self.stroke_width_var.get()
-                stroke_opacity = int(self.stroke_opacity_var.get() * 255)
-                stroke_color = self.stroke_color + (stroke_opacity,)
-                
-                # Draw stroke by drawing text multiple times with offset
-                for adj in range(-stroke_width, stroke_width + 1):
-                    for adj2 in range(-stroke_width, stroke_width + 1):
-                        if adj != 0 or adj2 != 0:
-                            draw.text((position[0] + adj, position[1] + adj2), text, 
-                                    font=font_obj, fill=stroke_color)
+            # Fully opaque plain text: draw the glyphs straight onto the frame
+            # copy, with no intermediate layer to allocate or composite
+            if text_rgba[3] == 255 and not bg_enabled and not stroke_enabled:
+                font_obj, _, position = self._layout_text(
+                    text, position, font_family, font_size, alignment)
+                preview = frame.copy()
+                ImageDraw.Draw(preview).text(position, text, font=font_obj, fill=text_rgba)
+                return preview
             
-            # Draw text
-            draw.text(position, text, font=font_obj, fill=text_color)
+            # Blend the cached text layer over its own bounding box only
+            text_layer, placement = self.get_text_layer(frame.size, settings)
+            if placement is None:
+                return frame
             
+            # The layer is pre-clipped to the frame, so this blends the whole
+            # layer with no per-frame crop of it
+            preview = frame.copy()
+            preview.alpha_composite(text_layer, dest=placement)
             return preview
             
         except Exception as e:
             print(f"Preview creation error: {e}")
             return None
     
-    def display_preview_frame(self, frame=None):
-        """Display a frame in the preview canvas."""
-        try:
-            # Use provided frame or create preview
-            if frame is None:
-                frame = self.create_text_preview()
-            
-            if frame is None:
-                return
+    def get_text_layer(self, size, settings):
+        """
+        Get a transparent layer with the text, stroke and background drawn on it.
+        
+        The layer only covers the text's bounding box (stroke and background
+        included), so building and blending it touches far fewer pixels than
+        a full-frame overlay. It only depends on the text settings, not on the
+        frame, so the last rendered layer is reused until a setting changes.
+        
+        Positions and sizes are given in GIF coordinates and are scaled by
+        display_scale, since the layer is composited onto display-sized frames.
+        
+        Args:
+            size: Size (width, height) of the frame the layer is composited onto
+            settings: Text settings snapshot from _text_settings()
             
-            # Convert PIL image to PhotoImage
-            photo = ImageTk.PhotoImage(frame)
+        Returns:
+            Tuple of (RGBA layer clipped to the frame, placement), where
+            placement is the layer's (x, y) offset on the frame, or None if
+            no part of the layer lands on the frame
+        """
+        scale = self.display_scale
+        key = (size, scale, settings)
+        if key == self._text_layer_key:
+            return self._text_layer, self._text_layer_placement
+        
+        (text, position, font_family, font_size, alignment, text_rgba,
+         bg_enabled, bg_rgba, stroke_enabled, stroke_width, stroke_rgba) = settings
+        
+        stroke_width = round(stroke_width * scale) if stroke_enabled else 0
+        font_obj, bbox, position = self._layout_text(
+            text, position, font_family, font_size, alignment)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+        
+        # Frame-space bounds of the glyphs, grown by the stroke
+        left = position[0] + bbox[0] - stroke_width
+        top = position[1] + bbox[1] - stroke_width
+        right = position[0] + bbox[2] + stroke_width
+        bottom = position[1] + bbox[3] + stroke_width
+        
+        if bg_enabled:
+            # Calculate background bounds
+            padding = round(5 * scale)
+            bg_bbox = (
+                position[0] - padding,
+                position[1] - padding,
+                position[0] + text_width + padding,
+                position[1] + text_height + padding
+            )
+            # rectangle() includes its end coordinates
+            left = min(left, bg_bbox[0])
+            top = min(top, bg_bbox[1])
+            right = max(right, bg_bbox[2] + 1)
+            bottom = max(bottom, bg_bbox[3] + 1)
+        
+        layer = Image.new('RGBA', (max(1, right - left), max(1, bottom - top)), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(layer)
+        
+        # Draw in layer coordinates
+        local_position = (position[0] - left, position[1] - top)
+        
+        # Draw background if enabled
+        if bg_enabled:
+            draw.rectangle((bg_bbox[0] - left, bg_bbox[1] - top,
+                            bg_bbox[2] - left, bg_bbox[3] - top), fill=bg_rgba)
+        
+        # Draw text, with PIL's outline stroke if enabled
+        if stroke_width:
+            draw.text(local_position, text, font=font_obj, fill=text_rgba,
+                      stroke_width=stroke_width, stroke_fill=stroke_rgba)
+        else:
+            draw.text(local_position, text, font=font_obj, fill=text_rgba)
+        
+        # Clip the layer to the frame once here, rather than having
+        # alpha_composite crop it again for every frame it is blended onto
+        placement = (max(left, 0), max(top, 0))
+        source = (placement[0] - left, placement[1] - top,
+                  min(right, size[0]) - left, min(bottom, size[1]) - top)
+        if source[0] >= source[2] or source[1] >= source[3]:
+            placement = None
+        elif source != (0, 0) + layer.size:
+            layer = layer.crop(source)
+        
+        self._text_layer_key = key
+        self._text_layer = layer
+        self._text_layer_placement = placement
+        return layer, placement
+    
+    def _layout_text(self, text, position, font_family, font_size, alignment):
+        """
+        Scale text placement to display coordinates and apply alignment.
+        
+        Returns:
+            Tuple of (font, text bbox at the origin, aligned display position)
+        """
+        scale = self.display_scale
+        position = (int(position[0] * scale), int(position[1] * scale))
+        font_size = max(1, round(font_size * scale))
+        
+        # Get (cached) font and text bounds
+        font_obj = _load_font(font_family, font_size)
+        bbox = _text_bbox(font_family, font_size, text)
+        text_width = bbox[2] - bbox[0]
+        
+        # Adjust position based on alignment
+        if alignment == 'center':
+            position = (position[0] - text_width // 2, position[1])
+        elif alignment == 'right':
+            position = (position[0] - text_width, position[1])
+        
+        return font_obj, bbox, position
+    
+    def get_display_frame(self, frames, generation, index, canvas_size):
+        """
+        Get a frame resized to fit the preview canvas.
+        
+        Resized frames are cached and only rebuilt when the canvas size or the
+        loaded GIF changes.
+        
+        Args:
+            frames: RGBA frames of the loaded GIF
+            generation: Load generation the frames belong to
+            index: Frame index
+            canvas_size: Canvas size (width, height)
             
-            # Resize to fit canvas
-            canvas_width = self.preview_canvas.winfo_width()
-            canvas_height = self.preview_canvas.winfo_height()
+        Returns:
+            RGBA image fitted to the canvas, or None if the canvas is not mapped yet
+        """
+        canvas_width, canvas_height = canvas_size
+        if canvas_width <= 1 or canvas_height <= 1 or not frames:
+            return None
+        
+        # Recompute the fit and drop stale frames when the canvas or GIF changes
+        cache_key = (generation, canvas_size)
+        if cache_key != self._display_cache_key:
+            width, height = frames[0].size
+            self.display_scale = min(canvas_width / width, canvas_height / height)
+            self._display_size = (max(1, int(width * self.display_scale)),
+                                  max(1, int(height * self.display_scale)))
+            self._display_frames = [None] * len(frames)
+            self._display_cache_key = cache_key
+        
+        frame = self._display_frames[index]
+        if frame is None:
+            frame = frames[index].resize(self._display_size, Image.Resampling.LANCZOS)
+            self._display_frames[index] = frame
+        return frame
+    
+    def display_preview_frame(self, frame):
+        """Display a display-sized frame in the preview canvas."""
+        try:
+            canvas_width, canvas_height = self._canvas_size
             
             if canvas_width <= 1 or canvas_height <= 1:
                 return
             
-            # Calculate scale to fit
-            scale = min(canvas_width / frame.width, canvas_height / frame.height)
-            new_width = int(frame.width * scale)
-            new_height = int(frame.height * scale)
-            
-            # Resize frame
-            resized = frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            center = (canvas_width // 2, canvas_height // 2)
             
-            # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(resized)
+            if self._photo is not None and (self._photo.width(), self._photo.height()) == frame.size:
+                # Same size as the shown frame: upload the pixels into it
+                self._photo.paste(frame)
+            else:
+                # Size changed (or first frame): create a new Tk image
+                self._photo = ImageTk.PhotoImage(frame)
+                if self._canvas_item is None:
+                    self._canvas_item = self.preview_canvas.create_image(*center, image=self._photo)
+                else:
+                    self.preview_canvas.itemconfig(self._canvas_item, image=self._photo)
             
-            # Clear canvas and display
-            self.preview_canvas.delete("all")
-            self.preview_canvas.create_image(canvas_width//2, canvas_height//2, image=photo)
-            self.preview_canvas.image = photo  # Keep reference
+            self.preview_canvas.coords(self._canvas_item, *center)
             
         except Exception as e:
             print(f"Display error: {e}")
@@ -604,29 +947,31 @@ class AddTextPanel:
         if self.is_playing:
             self.is_playing = False
             self.play_btn.config(text="▶")
+            if self._play_after_id is not None:
+                self.parent.after_cancel(self._play_after_id)
+                self._play_after_id = None
         else:
             self.is_playing = True
             self.play_btn.config(text="⏸")
             self.start_play_loop()
     
     def start_play_loop(self):
-        """Start the play loop in a separate thread."""
-        if self.play_thread and self.play_thread.is_alive():
+        """Start the play loop on the Tk event loop."""
+        if self._play_after_id is not None:
             return
         
-        self.play_thread = threading.Thread(target=self.play_loop, daemon=True)
-        self.play_thread.start()
+        self._next_frame_time = time.monotonic()
+        self.play_loop()
     
     def play_loop(self):
         """Play loop for animated preview."""
+        self._play_after_id = None
         if not self.is_playing or not self.preview_gif or not self.preview_gif.is_animated:
             return
         
         try:
-            # Update preview
-            preview_frame = self.create_text_preview()
-            if preview_frame:
-                self.display_preview_frame(preview_frame)
+            # Render the current frame on the worker; it is shown when ready
+            self.request_render(self._render_key())
             
             # Move to next frame
             self.current_frame = (self.current_frame + 1) % len(self.preview_frames)
@@ -637,9 +982,13 @@ class AddTextPanel:
             if hasattr(self, 'frame_scale') and self.frame_scale:
                 self.frame_scale.set(self.current_frame)
             
-            # Schedule next frame
-            delay = int(1000 / (self.speed_var.get() * 10))  # Convert speed to delay
-            self.parent.after(delay, self.play_loop)
+            # Schedule next frame against a monotonic deadline so render
+            # time does not add to the frame interval
+            delay = 1.0 / (self.speed_var.get() * 10)  # Convert speed to delay
+            now = time.monotonic()
+            self._next_frame_time = max(self._next_frame_time + delay, now)
+            wait_ms = int((self._next_frame_time - now) * 1000)
+            self._play_after_id = self.parent.after(wait_ms, self.play_loop)
             
         except Exception as e:
             print(f"Play loop error: {e}")
@@ -649,14 +998,16 @@ class AddTextPanel:
     
     def on_frame_change(self, event):
         """Handle frame number change."""
-        try:
-            frame_num = int(self.frame_var.get())
-            if 0 <= frame_num < len(self.preview_frames):
-                self.current_frame = frame_num
-                self.frame_scale.set(frame_num)
-                self.update_preview()
-        except ValueError:
-            pass
+        # The entry only accepts digits, so the value is either empty or an int
+        value = self.frame_var.get()
+        if not value:
+            return
+        
+        frame_num = int(value)
+        if frame_num < len(self.preview_frames):
+            self.current_frame = frame_num
+            self.frame_scale.set(frame_num)
+            self.update_preview()
     
     def on_frame_scale_change(self, value):
         """Handle frame scale change."""
@@ -705,7 +1056,8 @@ class AddTextPanel:
             settings = self.get_settings()
             
             if self.on_process:
-                self.on_process('add_text', settings)
+                if self.on_process('add_text', settings, on_complete=self._on_add_text_complete):
+                    self.start_progress()
             else:
                 messagebox.showinfo("Add Text", f"Add text settings: {settings}")
                 
@@ -714,6 +1066,11 @@ class AddTextPanel:
         except Exception as e:
             messagebox.showerror("Error", f"Add text failed: {e}")
     
+    def _on_add_text_complete(self, success: bool):
+        """Called on the Tk thread when the queued add text task finishes."""
+        if self.main_container.winfo_exists():
+            self.stop_progress()
+    
     def start_progress(self):
         """Start the progress bar."""
         self.progress_bar.start()
@@ -725,12 +1082,14 @@ class AddTextPanel:
         self.process_btn.config(state=tk.NORMAL)
     
     def get_widget(self) -> tk.Widget:
-        """Get the main widget for this panel."""
+        """Get the main widget for this panel, building it on first access."""
+        self._ensure_built()
         return self.main_container
     
     def auto_load_gif(self, file_path: Path):
         """Auto-load GIF file for text addition."""
         try:
+            self._ensure_built()
             self.current_file = file_path
             # Load immediately
             self.load_gif_preview(file_path)
@@ -744,12 +1103,13 @@ class AddTextPanel:
             # Load GIF
             self.preview_gif = Image.open(file_path)
             
-            # Load frames if animated
+            # Load frames if animated, decoding each straight to RGBA
+            # (convert() returns a new image, so no intermediate copy is needed)
             if self.preview_gif.is_animated:
                 self.preview_frames = []
                 for i in range(self.preview_gif.n_frames):
                     self.preview_gif.seek(i)
-                    self.preview_frames.append(self.preview_gif.copy())
+                    self.preview_frames.append(self.preview_gif.convert('RGBA'))
                 
                 # Setup frame controls
                 self.frame_scale.config(to=len(self.preview_frames) - 1)
@@ -757,20 +1117,20 @@ class AddTextPanel:
                 self.current_frame = 0
                 self.status_label.config(text=f"Loaded: {file_path.name} ({len(self.preview_frames)} frames)")
             else:
-                self.preview_frames = [self.preview_gif]
+                self.preview_frames = [self.preview_gif.convert('RGBA')]
                 self.frame_scale.config(to=0)
                 self.frame_var.set("0")
                 self.current_frame = 0
                 self.status_label.config(text=f"Loaded: {file_path.name} (Static)")
             
+            # Invalidate display-sized frames and renders from any previous GIF
+            self._preview_generation += 1
+            
             # Set initial position
             self.text_position = (10, 10)
             self.click_pos_var.set("Position: (10, 10)")
             
-            # Display first frame without text first
-            self.display_preview_frame(self.preview_frames[0])
-            
-            # Then update with text
+            # Render the first frame with text
             self.update_preview()
             
         except Exception as e:
@@ -10,8 +10,6 @@ from pathlib import Path
 from typing import Optional, Callable, Any
 import threading
 
-from gif_tools.core.extract_frames import extract_gif_frames
-
 
 class CombineFramesPanel:
     """Panel for combining extracted frames back into a GIF."""
@@ -113,9 +111,13 @@ class CombineFramesPanel:
         )
         self.process_btn.grid(row=3, column=0, columnspan=3, pady=10)
         
+        # Determinate: driven by the combine's per-frame progress reports
+        self.progress_var = tk.DoubleVar()
         self.progress_bar = ttk.Progressbar(
             self.frame,
-            mode='indeterminate'
+            variable=self.progress_var,
+            mode='determinate',
+            maximum=100
         )
         self.progress_bar.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=5)
         
@@ -220,21 +222,36 @@ class CombineFramesPanel:
             }
             
             if self.on_process:
-                self.on_process('combine_frames', settings)
+                # The combine runs on the app's processing thread; keep the
+                # progress bar running until it reports back
+                if self.on_process('combine_frames', settings,
+                                   on_complete=self._on_combine_complete,
+                                   on_progress=self._on_combine_progress):
+                    self.start_progress()
             else:
                 messagebox.showinfo("Combine Frames", f"Combine frames settings: {settings}")
                 
         except Exception as e:
             messagebox.showerror("Error", f"Combine frames failed: {e}")
     
+    def _on_combine_progress(self, progress: int):
+        """Called on the Tk thread with the queued combine task's progress."""
+        if self.frame.winfo_exists():
+            self.progress_var.set(progress)
+    
+    def _on_combine_complete(self, success: bool):
+        """Called on the Tk thread when the queued combine task finishes."""
+        if self.frame.winfo_exists():
+            self.stop_progress(success)
+    
     def start_progress(self):
-        """Start the progress bar."""
-        self.progress_bar.start()
+        """Reset the progress bar and disable processing."""
+        self.progress_var.set(0)
         self.process_btn.config(state=tk.DISABLED)
     
-    def stop_progress(self):
-        """Stop the progress bar."""
-        self.progress_bar.stop()
+    def stop_progress(self, success: bool = True):
+        """Fill (or clear, on failure) the progress bar and re-enable processing."""
+        self.progress_var.set(100 if success else 0)
         self.process_btn.config(state=tk.NORMAL)
     
     def get_widget(self) -> tk.Widget:
@@ -5,13 +5,40 @@ GUI panel for the GIF crop tool with interactive controls.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
 from typing import Optional, Callable, Any
+import functools
 import threading
+import traceback
 
 from PIL import Image, ImageTk
-from gif_tools.core.crop import crop_gif
+
+# Largest size of the decoded frame kept for drawing the crop preview
+_PREVIEW_BASE_SIZE = (1024, 1024)
+
+# Manual crop presets: button label -> (x, y, width, height)
+_CROP_PRESETS = {
+    "Center Square": (50, 50, 100, 100),
+    "Top Half": (0, 0, 200, 100),
+    "Bottom Half": (0, 100, 200, 100),
+    "Left Half": (0, 0, 100, 200),
+    "Right Half": (100, 0, 100, 200),
+}
+
+# Background choices, resolved to RGB once (same values as PIL's ImageColor)
+_BACKGROUND_COLORS = {
+    "white": (255, 255, 255),
+    "black": (0, 0, 0),
+    "red": (255, 0, 0),
+    "green": (0, 128, 0),
+    "blue": (0, 0, 255),
+}
+
+
+def _is_digits(value: str) -> bool:
+    """Entry validator allowing only an empty string or decimal digits."""
+    return value == "" or value.isdecimal()
 
 
 class CropPanel(ttk.Frame):
@@ -72,6 +99,13 @@ class CropPanel(ttk.Frame):
         self.canvas = tk.Canvas(preview_frame, bg="white", cursor="crosshair", width=400, height=300)
         self.canvas.pack(fill=tk.BOTH, expand=True)
         
+        # Crop selection rectangle, created once and moved/shown as needed
+        self.crop_rect = self.canvas.create_rectangle(
+            0, 0, 0, 0,
+            outline="red", width=2,
+            state='hidden'
+        )
+        
         # Bind mouse events for crop selection
         self.canvas.bind("<Button-1>", self.start_crop_selection)
         self.canvas.bind("<B1-Motion>", self.update_crop_selection)
@@ -126,41 +160,38 @@ class CropPanel(ttk.Frame):
         self.crop_start_y = None
         self.crop_end_x = None
         self.crop_end_y = None
-        self.crop_rect = None
+        self._motion_pending = False
         self.current_gif = None
         self.image_scale = 1.0
+        self._inv_scale = 1.0  # 1 / image_scale, for canvas -> image mapping
+        self._gif_w = self._gif_h = 0  # Size of current_gif, cached on load
         self.image_offset_x = 0
         self.image_offset_y = 0
         self.aspect_ratio = None  # Will be set based on selection
+        
+        # Display size the cached preview PhotoImage was built for; reset
+        # whenever a new GIF is loaded
+        self.display_photo = None
+        self._preview_key = None
+        
+        # Downscaled first frame of the current GIF (see set_current_gif)
+        self._preview_base = None
     
     def setup_manual_crop(self):
         """Setup manual crop interface."""
         # Crop coordinates
         ttk.Label(self.manual_frame, text="Crop Area:").grid(row=0, column=0, sticky=tk.W, pady=5)
         
-        # X coordinate
-        ttk.Label(self.manual_frame, text="X (left):").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.x_var = tk.StringVar(value="0")
-        x_entry = ttk.Entry(self.manual_frame, textvariable=self.x_var, width=10)
-        x_entry.grid(row=1, column=1, sticky=tk.W, padx=(5, 0), pady=5)
-        
-        # Y coordinate
-        ttk.Label(self.manual_frame, text="Y (top):").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.y_var = tk.StringVar(value="0")
-        y_entry = ttk.Entry(self.manual_frame, textvariable=self.y_var, width=10)
-        y_entry.grid(row=2, column=1, sticky=tk.W, padx=(5, 0), pady=5)
-        
-        # Width
-        ttk.Label(self.manual_frame, text="Width:").grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.width_var = tk.StringVar(value="100")
-        width_entry = ttk.Entry(self.manual_frame, textvariable=self.width_var, width=10)
-        width_entry.grid(row=3, column=1, sticky=tk.W, padx=(5, 0), pady=5)
-        
-        # Height
-        ttk.Label(self.manual_frame, text="Height:").grid(row=4, column=0, sticky=tk.W, pady=5)
-        self.height_var = tk.StringVar(value="100")
-        height_entry = ttk.Entry(self.manual_frame, textvariable=self.height_var, width=10)
-        height_entry.grid(row=4, column=1, sticky=tk.W, padx=(5, 0), pady=5)
+        # Coordinate fields only accept digits; each one's value is parsed
+        # once when it changes and cached in _crop_ints for get_settings
+        validate_digits = (self.register(_is_digits), '%P')
+        self._crop_ints = {'x': 0, 'y': 0, 'width': 100, 'height': 100}
+        self._crop_var_keys = {}
+        
+        self.x_var = self._coordinate_entry(1, 'x', "X (left):", validate_digits)
+        self.y_var = self._coordinate_entry(2, 'y', "Y (top):", validate_digits)
+        self.width_var = self._coordinate_entry(3, 'width', "Width:", validate_digits)
+        self.height_var = self._coordinate_entry(4, 'height', "Height:", validate_digits)
         
         # Preset crop options
         ttk.Label(self.manual_frame, text="Presets:").grid(row=5, column=0, sticky=tk.W, pady=5)
@@ -168,16 +199,9 @@ class CropPanel(ttk.Frame):
         preset_frame = ttk.Frame(self.manual_frame)
         preset_frame.grid(row=5, column=1, columnspan=2, sticky=(tk.W, tk.E), pady=5)
         
-        preset_buttons = [
-            ("Center Square", self.set_center_square),
-            ("Top Half", self.set_top_half),
-            ("Bottom Half", self.set_bottom_half),
-            ("Left Half", self.set_left_half),
-            ("Right Half", self.set_right_half),
-        ]
-        
-        for i, (text, command) in enumerate(preset_buttons):
+        for i, (text, crop_area) in enumerate(_CROP_PRESETS.items()):
             row, col = divmod(i, 2)
+            command = functools.partial(self.apply_preset, crop_area)
             btn = ttk.Button(preset_frame, text=text, command=command, width=12)
             btn.grid(row=row, column=col, padx=2, pady=2)
         
@@ -193,6 +217,18 @@ class CropPanel(ttk.Frame):
         )
         mode_combo.grid(row=6, column=1, sticky=tk.W, padx=(5, 0), pady=5)
     
+    def _coordinate_entry(self, row, key, label, validatecommand):
+        """Create a labelled coordinate entry whose value is cached under key."""
+        ttk.Label(self.manual_frame, text=label).grid(row=row, column=0, sticky=tk.W, pady=5)
+        var = tk.IntVar(value=self._crop_ints[key])
+        entry = ttk.Entry(self.manual_frame, textvariable=var, width=10,
+                          validate='key', validatecommand=validatecommand)
+        entry.grid(row=row, column=1, sticky=tk.W, padx=(5, 0), pady=5)
+        
+        var.trace('w', self._on_crop_var_write)
+        self._crop_var_keys[str(var)] = key
+        return var
+    
     def setup_common_controls(self):
         """Setup common controls for both tabs."""
         # Quality controls
@@ -212,8 +248,8 @@ class CropPanel(ttk.Frame):
         self.quality_label = ttk.Label(self.frame, text="85")
         self.quality_label.grid(row=7, column=3, sticky=tk.W, padx=(5, 0), pady=5)
         
-        # Update quality label when scale changes
-        quality_scale.configure(command=self.update_quality_label)
+        # Update quality label when the value changes
+        self.quality_var.trace('w', self._on_quality_write)
         
         # Background color
         ttk.Label(self.frame, text="Background:").grid(row=8, column=0, sticky=tk.W, pady=5)
@@ -221,7 +257,7 @@ class CropPanel(ttk.Frame):
         bg_combo = ttk.Combobox(
             self.frame, 
             textvariable=self.bg_color_var,
-            values=["transparent", "white", "black", "red", "green", "blue"],
+            values=["transparent", *_BACKGROUND_COLORS],
             state="readonly",
             width=15
         )
@@ -240,7 +276,8 @@ class CropPanel(ttk.Frame):
         self.progress_bar = ttk.Progressbar(
             self.frame, 
             variable=self.progress_var,
-            mode='indeterminate'
+            mode='determinate',
+            maximum=100
         )
         self.progress_bar.grid(row=10, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=5)
         
@@ -250,11 +287,28 @@ class CropPanel(ttk.Frame):
         # Pack the frame
         self.frame.pack(fill=tk.BOTH, expand=True)
     
+    def set_current_gif(self, gif):
+        """
+        Make gif the image being cropped and prepare its preview source.
+        
+        The first frame is decoded once into a bounded-size thumbnail;
+        preview redraws scale that instead of the full-resolution GIF. The
+        thumbnail only carries an alpha channel when the GIF has one, so
+        opaque palette GIFs expand to 3 bytes per pixel rather than 4.
+        """
+        self.current_gif = gif
+        self._gif_w, self._gif_h = gif.size
+        self.current_gif.seek(0)
+        has_alpha = 'transparency' in gif.info or gif.mode in ('RGBA', 'LA', 'PA')
+        self._preview_base = self.current_gif.convert('RGBA' if has_alpha else 'RGB')
+        self._preview_base.thumbnail(_PREVIEW_BASE_SIZE, Image.Resampling.LANCZOS)
+        self._preview_key = None
+    
     def auto_load_gif(self, file_path: str):
         """Auto-load GIF from file path."""
         try:
             print(f"Auto-loading GIF: {file_path}")
-            self.current_gif = Image.open(file_path)
+            self.set_current_gif(Image.open(file_path))
             print(f"GIF auto-loaded successfully: {self.current_gif.size}")
             # Schedule display after UI is ready
             self.after(100, self.display_gif_preview)
@@ -264,7 +318,6 @@ class CropPanel(ttk.Frame):
     
     def load_gif_for_crop(self):
         """Load GIF for visual cropping."""
-        from tkinter import filedialog
         file_path = filedialog.askopenfilename(
             title="Select GIF file",
             filetypes=[("GIF files", "*.gif"), ("All files", "*.*")]
@@ -272,7 +325,7 @@ class CropPanel(ttk.Frame):
         if file_path:
             try:
                 print(f"Loading GIF: {file_path}")
-                self.current_gif = Image.open(file_path)
+                self.set_current_gif(Image.open(file_path))
                 print(f"GIF loaded successfully: {self.current_gif.size}")
                 self.display_gif_preview()
             except Exception as e:
@@ -287,8 +340,10 @@ class CropPanel(ttk.Frame):
         
         try:
             print("Starting to display GIF preview")
-            # Clear canvas
-            self.canvas.delete("all")
+            # Clear the previous preview and hide the old selection; the crop
+            # rectangle item itself is kept and reused
+            self.canvas.delete("preview")
+            self.canvas.itemconfig(self.crop_rect, state='hidden')
             
             # Force canvas to update and get actual size
             self.canvas.update_idletasks()
@@ -305,14 +360,15 @@ class CropPanel(ttk.Frame):
                 self.canvas.config(width=canvas_width, height=canvas_height)
                 print(f"Set canvas to minimum size: {canvas_width}x{canvas_height}")
             
-            img_width = self.current_gif.width
-            img_height = self.current_gif.height
+            img_width = self._gif_w
+            img_height = self._gif_h
             print(f"Image size: {img_width}x{img_height}")
             
             # Calculate scale to fit canvas with some padding
             scale_x = (canvas_width - 20) / img_width
             scale_y = (canvas_height - 20) / img_height
             self.image_scale = min(scale_x, scale_y, 1.0)  # Don't scale up
+            self._inv_scale = 1.0 / self.image_scale if self.image_scale else 1.0
             print(f"Image scale: {self.image_scale}")
             
             # Calculate centered position
@@ -324,19 +380,26 @@ class CropPanel(ttk.Frame):
             self.image_offset_y = (canvas_height - scaled_height) // 2
             print(f"Image offset: ({self.image_offset_x}, {self.image_offset_y})")
             
-            # Resize image for display
-            display_img = self.current_gif.resize((scaled_width, scaled_height), Image.Resampling.LANCZOS)
-            print("Image resized successfully")
-            
-            # Convert to PhotoImage
-            self.display_photo = ImageTk.PhotoImage(display_img)
-            print("PhotoImage created successfully")
+            # Resize and convert only when the GIF or the display size changed;
+            # otherwise the cached PhotoImage is redrawn as-is
+            preview_key = (scaled_width, scaled_height)
+            if self._preview_key != preview_key:
+                # Bilinear is plenty for an on-screen preview and much cheaper
+                # than LANCZOS on large frames
+                display_img = self._preview_base.resize((scaled_width, scaled_height), Image.Resampling.BILINEAR)
+                print("Image resized successfully")
+                
+                # Convert to PhotoImage
+                self.display_photo = ImageTk.PhotoImage(display_img)
+                self._preview_key = preview_key
+                print("PhotoImage created successfully")
             
             # Display image
             self.canvas.create_image(
                 self.image_offset_x + scaled_width // 2,
                 self.image_offset_y + scaled_height // 2,
-                image=self.display_photo
+                image=self.display_photo,
+                tags="preview"
             )
             print("Image displayed on canvas")
             
@@ -344,14 +407,17 @@ class CropPanel(ttk.Frame):
             self.canvas.create_rectangle(
                 self.image_offset_x, self.image_offset_y,
                 self.image_offset_x + scaled_width, self.image_offset_y + scaled_height,
-                outline="gray", width=1
+                outline="gray", width=1,
+                tags="preview"
             )
+            
+            # Keep the crop rectangle above the new preview items
+            self.canvas.tag_raise(self.crop_rect)
             print("Border added")
             
         except Exception as e:
             print(f"Error in display_gif_preview: {e}")
             messagebox.showerror("Error", f"Failed to display GIF preview: {e}")
-            import traceback
             traceback.print_exc()
     
     def start_crop_selection(self, event):
@@ -361,9 +427,9 @@ class CropPanel(ttk.Frame):
         self.crop_end_x = event.x
         self.crop_end_y = event.y
         
-        # Clear previous crop rectangle
-        if self.crop_rect:
-            self.canvas.delete(self.crop_rect)
+        # Restart the selection rectangle at the click point
+        self.canvas.coords(self.crop_rect, event.x, event.y, event.x, event.y)
+        self.canvas.itemconfig(self.crop_rect, state='normal')
     
     def update_crop_selection(self, event):
         """Update crop area selection."""
@@ -373,24 +439,10 @@ class CropPanel(ttk.Frame):
         self.crop_end_x = event.x
         self.crop_end_y = event.y
         
-        # Clear previous rectangle
-        if self.crop_rect:
-            self.canvas.delete(self.crop_rect)
-        
-        # Apply aspect ratio constraint
-        x1, y1, x2, y2 = self.constrain_to_aspect_ratio(
-            self.crop_start_x, self.crop_start_y,
-            self.crop_end_x, self.crop_end_y
-        )
-        
-        # Draw new rectangle
-        self.crop_rect = self.canvas.create_rectangle(
-            x1, y1, x2, y2,
-            outline="red", width=2, fill="", stipple="gray50"
-        )
-        
-        # Update crop info
-        self.update_crop_info()
+        # Coalesce bursts of motion events into one redraw per idle cycle
+        if not self._motion_pending:
+            self._motion_pending = True
+            self.after_idle(self.redraw_crop_selection)
     
     def end_crop_selection(self, event):
         """End crop area selection."""
@@ -400,29 +452,63 @@ class CropPanel(ttk.Frame):
         self.crop_end_x = event.x
         self.crop_end_y = event.y
         
+        # Draw the final rectangle right away and fill in the manual fields
+        self.redraw_crop_selection(commit=True)
+    
+    def redraw_crop_selection(self, commit: bool = False):
+        """
+        Move the crop rectangle to the current selection and update the info.
+        
+        Args:
+            commit: Also update the manual crop fields (see update_crop_info)
+        """
+        self._motion_pending = False
+        if self.crop_start_x is None:
+            return
+        
         # Apply aspect ratio constraint
         x1, y1, x2, y2 = self.constrain_to_aspect_ratio(
             self.crop_start_x, self.crop_start_y,
             self.crop_end_x, self.crop_end_y
         )
         
-        # Update final rectangle
-        if self.crop_rect:
-            self.canvas.delete(self.crop_rect)
-        
-        self.crop_rect = self.canvas.create_rectangle(
-            x1, y1, x2, y2,
-            outline="red", width=2, fill="", stipple="gray50"
-        )
+        # Move the persistent rectangle instead of recreating it
+        self.canvas.coords(self.crop_rect, x1, y1, x2, y2)
         
         # Update crop info
-        self.update_crop_info()
+        self.update_crop_info(commit=commit)
     
-    def update_crop_info(self):
-        """Update crop area information."""
-        if self.crop_start_x is None or self.crop_end_x is None:
+    def update_crop_info(self, commit: bool = True):
+        """
+        Update crop area information.
+        
+        Args:
+            commit: Also copy the area into the manual crop fields. Drags
+                only refresh the label and commit once on release.
+        """
+        crop_area = self._compute_crop_coords()
+        if crop_area is None:
             return
         
+        img_x1, img_y1, width, height = crop_area
+        
+        # Update info label
+        self.crop_info_label.config(text=f"X: {img_x1}, Y: {img_y1}, W: {width}, H: {height}")
+        
+        if commit:
+            self._commit_crop_vars(crop_area)
+    
+    def _compute_crop_coords(self):
+        """
+        Convert the canvas selection to image coordinates.
+        
+        Returns:
+            Tuple of (x, y, width, height) in image pixels, or None if there
+            is no selection or no GIF loaded
+        """
+        if self.crop_start_x is None or self.crop_end_x is None or not self.current_gif:
+            return None
+        
         # Calculate crop area in canvas coordinates
         x1 = min(self.crop_start_x, self.crop_end_x)
         y1 = min(self.crop_start_y, self.crop_end_y)
@@ -430,30 +516,28 @@ class CropPanel(ttk.Frame):
         y2 = max(self.crop_start_y, self.crop_end_y)
         
         # Convert to image coordinates
-        if self.current_gif:
-            img_x1 = int((x1 - self.image_offset_x) / self.image_scale)
-            img_y1 = int((y1 - self.image_offset_y) / self.image_scale)
-            img_x2 = int((x2 - self.image_offset_x) / self.image_scale)
-            img_y2 = int((y2 - self.image_offset_y) / self.image_scale)
-            
-            # Ensure coordinates are within image bounds
-            img_x1 = max(0, min(img_x1, self.current_gif.width))
-            img_y1 = max(0, min(img_y1, self.current_gif.height))
-            img_x2 = max(0, min(img_x2, self.current_gif.width))
-            img_y2 = max(0, min(img_y2, self.current_gif.height))
-            
-            # Calculate width and height
-            width = img_x2 - img_x1
-            height = img_y2 - img_y1
-            
-            # Update info label
-            self.crop_info_label.config(text=f"X: {img_x1}, Y: {img_y1}, W: {width}, H: {height}")
-            
-            # Update manual crop fields
-            self.x_var.set(str(img_x1))
-            self.y_var.set(str(img_y1))
-            self.width_var.set(str(width))
-            self.height_var.set(str(height))
+        inv_scale = self._inv_scale
+        img_x1 = int((x1 - self.image_offset_x) * inv_scale)
+        img_y1 = int((y1 - self.image_offset_y) * inv_scale)
+        img_x2 = int((x2 - self.image_offset_x) * inv_scale)
+        img_y2 = int((y2 - self.image_offset_y) * inv_scale)
+        
+        # Ensure coordinates are within image bounds
+        img_x1 = max(0, min(img_x1, self._gif_w))
+        img_y1 = max(0, min(img_y1, self._gif_h))
+        img_x2 = max(0, min(img_x2, self._gif_w))
+        img_y2 = max(0, min(img_y2, self._gif_h))
+        
+        # Calculate width and height
+        return img_x1, img_y1, img_x2 - img_x1, img_y2 - img_y1
+    
+    def _commit_crop_vars(self, crop_area):
+        """Copy a crop area (x, y, width, height) into the manual crop fields."""
+        x, y, width, height = crop_area
+        self.x_var.set(x)
+        self.y_var.set(y)
+        self.width_var.set(width)
+        self.height_var.set(height)
     
     def on_aspect_ratio_change(self, event=None):
         """Handle aspect ratio selection change."""
@@ -496,70 +580,41 @@ class CropPanel(ttk.Frame):
         
         return x1, y1, x2, y2
     
-    def set_center_square(self):
-        """Set crop area to center square."""
-        self.x_var.set("50")
-        self.y_var.set("50")
-        self.width_var.set("100")
-        self.height_var.set("100")
-    
-    def set_top_half(self):
-        """Set crop area to top half."""
-        self.x_var.set("0")
-        self.y_var.set("0")
-        self.width_var.set("200")
-        self.height_var.set("100")
+    def apply_preset(self, crop_area):
+        """Set the manual crop fields and info label to a preset (x, y, width, height)."""
+        self._commit_crop_vars(crop_area)
+        x, y, width, height = crop_area
+        self.crop_info_label.config(text=f"X: {x}, Y: {y}, W: {width}, H: {height}")
     
-    def set_bottom_half(self):
-        """Set crop area to bottom half."""
-        self.x_var.set("0")
-        self.y_var.set("100")
-        self.width_var.set("200")
-        self.height_var.set("100")
+    def _on_crop_var_write(self, name, *args):
+        """Parse and cache a coordinate field's value when it is written."""
+        value = self.getvar(name)
+        # Tcl hands back ints set from Python as-is and typed text as strings
+        self._crop_ints[self._crop_var_keys[name]] = int(value) if value != "" else None
     
-    def set_left_half(self):
-        """Set crop area to left half."""
-        self.x_var.set("0")
-        self.y_var.set("0")
-        self.width_var.set("100")
-        self.height_var.set("200")
-    
-    def set_right_half(self):
-        """Set crop area to right half."""
-        self.x_var.set("100")
-        self.y_var.set("0")
-        self.width_var.set("100")
-        self.height_var.set("200")
-    
-    def update_quality_label(self, value):
-        """Update the quality label when scale changes."""
-        self.quality_label.config(text=str(int(float(value))))
+    def _on_quality_write(self, *args):
+        """Update the quality label when the quality value changes."""
+        self.quality_label.config(text=str(self.quality_var.get()))
     
     def get_settings(self) -> dict:
         """Get current crop settings."""
-        try:
-            x = int(self.x_var.get())
-            y = int(self.y_var.get())
-            width = int(self.width_var.get())
-            height = int(self.height_var.get())
-            quality = self.quality_var.get()
-            
-        except ValueError as e:
-            raise ValueError(f"Invalid numeric value: {e}")
+        # Coordinates were parsed as they were typed (see _on_crop_var_write)
+        missing = [key for key, value in self._crop_ints.items() if value is None]
+        if missing:
+            raise ValueError(f"Invalid numeric value: {', '.join(missing)} is empty")
+        
+        quality = self.quality_var.get()
         
         settings = {
-            'x': x,
-            'y': y,
-            'width': width,
-            'height': height,
+            **self._crop_ints,
             'mode': self.mode_var.get(),
             'quality': quality
         }
         
-        # Add background color
+        # Add background color as an RGB tuple
         bg_color = self.bg_color_var.get()
         if bg_color != "transparent":
-            settings['background_color'] = bg_color
+            settings['background_color'] = _BACKGROUND_COLORS[bg_color]
         
         return settings
     
@@ -569,7 +624,12 @@ class CropPanel(ttk.Frame):
             settings = self.get_settings()
             
             if self.on_process:
-                self.on_process('crop', settings)
+                # The crop runs on the app's processing thread; the panel is
+                # told about progress and completion on the Tk thread
+                if self.on_process('crop', settings,
+                                   on_complete=self._on_crop_complete,
+                                   on_progress=self._on_crop_progress):
+                    self.start_progress()
             else:
                 messagebox.showinfo("Crop", f"Crop settings: {settings}")
                 
@@ -578,14 +638,24 @@ class CropPanel(ttk.Frame):
         except Exception as e:
             messagebox.showerror("Error", f"Crop failed: {e}")
     
+    def _on_crop_progress(self, progress: int):
+        """Called on the Tk thread with the queued crop task's progress."""
+        if self.winfo_exists():
+            self.progress_var.set(progress)
+    
+    def _on_crop_complete(self, success: bool):
+        """Called on the Tk thread when the queued crop task finishes."""
+        if self.winfo_exists():
+            self.stop_progress(success)
+    
     def start_progress(self):
-        """Start the progress bar."""
-        self.progress_bar.start()
+        """Reset the progress bar and disable processing."""
+        self.progress_var.set(0)
         self.process_btn.config(state=tk.DISABLED)
     
-    def stop_progress(self):
-        """Stop the progress bar."""
-        self.progress_bar.stop()
+    def stop_progress(self, success: bool = True):
+        """Fill (or clear, on failure) the progress bar and re-enable processing."""
+        self.progress_var.set(100 if success else 0)
         self.process_btn.config(state=tk.NORMAL)
     
     def get_widget(self) -> tk.Widget:
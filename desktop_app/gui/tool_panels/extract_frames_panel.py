@@ -8,9 +8,16 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
 from typing import Optional, Callable, Any
+import collections
+import re
 import threading
 
-from gif_tools.core.extract_frames import extract_gif_frames
+from PIL import Image
+
+# One "N" or "N-M" item of a frame list
+_FRAME_RE = re.compile(r'(\d+)\s*(?:-\s*(\d+))?')
+# A whole comma-separated frame list, e.g. "1,5,10-15"
+_FRAME_LIST_RE = re.compile(r'\s*{0}\s*(?:,\s*{0}\s*)*'.format(_FRAME_RE.pattern))
 
 
 class ExtractFramesPanel:
@@ -28,7 +35,14 @@ class ExtractFramesPanel:
         self.parent = parent
         self.on_process = on_process
         self.current_gif_path = None
+        self._gif_name = None
+        self._n_frames = None
         self.default_output_dir = default_output_dir
+        
+        # Progress reports waiting for the next coalesced progress bar update
+        self._progress_queue = collections.deque()
+        self._progress_pending = False
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -63,59 +77,15 @@ class ExtractFramesPanel:
                 command=self.update_controls
             ).grid(row=0, column=i, padx=(0, 20), sticky=tk.W)
         
-        # Specific frames controls
-        self.specific_frame = ttk.LabelFrame(self.frame, text="Specific Frames", padding="10")
-        self.specific_frame.grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
-        
-        ttk.Label(self.specific_frame, text="Frame Numbers:").grid(row=0, column=0, sticky=tk.W, pady=5)
+        # Method-specific controls are built the first time their method is
+        # selected; their variables exist up front so get_settings always works
         self.specific_frames_var = tk.StringVar(value="1,5,10,15")
-        ttk.Entry(
-            self.specific_frame,
-            textvariable=self.specific_frames_var,
-            width=30
-        ).grid(row=0, column=1, padx=(10, 0), pady=5, sticky=tk.W)
-        
-        ttk.Label(self.specific_frame, text="(e.g., 1,5,10,15 or 1-5,10-15)", foreground="gray").grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=2)
-        
-        # Range controls
-        self.range_frame = ttk.LabelFrame(self.frame, text="Frame Range", padding="10")
-        self.range_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
-        
-        ttk.Label(self.range_frame, text="From Frame:").grid(row=0, column=0, sticky=tk.W, pady=5)
         self.range_start_var = tk.IntVar(value=1)
-        ttk.Spinbox(
-            self.range_frame,
-            from_=1,
-            to=1000,
-            textvariable=self.range_start_var,
-            width=10
-        ).grid(row=0, column=1, padx=(10, 0), pady=5, sticky=tk.W)
-        
-        ttk.Label(self.range_frame, text="To Frame:").grid(row=0, column=2, sticky=tk.W, pady=5, padx=(20, 0))
         self.range_end_var = tk.IntVar(value=10)
-        ttk.Spinbox(
-            self.range_frame,
-            from_=1,
-            to=1000,
-            textvariable=self.range_end_var,
-            width=10
-        ).grid(row=0, column=3, padx=(10, 0), pady=5, sticky=tk.W)
-        
-        # Interval controls
-        self.interval_frame = ttk.LabelFrame(self.frame, text="Extract Every Nth Frame", padding="10")
-        self.interval_frame.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
-        
-        ttk.Label(self.interval_frame, text="Extract every:").grid(row=0, column=0, sticky=tk.W, pady=5)
         self.interval_var = tk.IntVar(value=2)
-        ttk.Spinbox(
-            self.interval_frame,
-            from_=1,
-            to=100,
-            textvariable=self.interval_var,
-            width=10
-        ).grid(row=0, column=1, padx=(10, 0), pady=5, sticky=tk.W)
-        
-        ttk.Label(self.interval_frame, text="frames (e.g., 2 = every 2nd frame)", foreground="gray").grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=2)
+        self.specific_frame = None
+        self.range_frame = None
+        self.interval_frame = None
         
         # Output settings
         self.output_frame = ttk.LabelFrame(self.frame, text="Output Settings", padding="10")
@@ -194,9 +164,12 @@ class ExtractFramesPanel:
         )
         self.process_btn.grid(row=6, column=0, columnspan=3, pady=10)
         
+        self.progress_var = tk.DoubleVar()
         self.progress_bar = ttk.Progressbar(
             self.frame,
-            mode='indeterminate'
+            variable=self.progress_var,
+            mode='determinate',
+            maximum=100
         )
         self.progress_bar.grid(row=7, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=5)
         
@@ -210,27 +183,86 @@ class ExtractFramesPanel:
         # Initialize controls visibility
         self.update_controls()
     
+    def _build_specific_frame(self) -> ttk.LabelFrame:
+        """Create the specific frames controls."""
+        specific_frame = ttk.LabelFrame(self.frame, text="Specific Frames", padding="10")
+        specific_frame.grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
+        
+        ttk.Label(specific_frame, text="Frame Numbers:").grid(row=0, column=0, sticky=tk.W, pady=5)
+        ttk.Entry(
+            specific_frame,
+            textvariable=self.specific_frames_var,
+            width=30
+        ).grid(row=0, column=1, padx=(10, 0), pady=5, sticky=tk.W)
+        
+        ttk.Label(specific_frame, text="(e.g., 1,5,10,15 or 1-5,10-15)", foreground="gray").grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=2)
+        return specific_frame
+    
+    def _build_range_frame(self) -> ttk.LabelFrame:
+        """Create the frame range controls."""
+        range_frame = ttk.LabelFrame(self.frame, text="Frame Range", padding="10")
+        range_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
+        
+        ttk.Label(range_frame, text="From Frame:").grid(row=0, column=0, sticky=tk.W, pady=5)
+        self.range_start_spin = ttk.Spinbox(
+            range_frame,
+            from_=1,
+            to=self._n_frames or 1000,
+            textvariable=self.range_start_var,
+            width=10
+        )
+        self.range_start_spin.grid(row=0, column=1, padx=(10, 0), pady=5, sticky=tk.W)
+        
+        ttk.Label(range_frame, text="To Frame:").grid(row=0, column=2, sticky=tk.W, pady=5, padx=(20, 0))
+        self.range_end_spin = ttk.Spinbox(
+            range_frame,
+            from_=1,
+            to=self._n_frames or 1000,
+            textvariable=self.range_end_var,
+            width=10
+        )
+        self.range_end_spin.grid(row=0, column=3, padx=(10, 0), pady=5, sticky=tk.W)
+        return range_frame
+    
+    def _build_interval_frame(self) -> ttk.LabelFrame:
+        """Create the every-Nth-frame controls."""
+        interval_frame = ttk.LabelFrame(self.frame, text="Extract Every Nth Frame", padding="10")
+        interval_frame.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
+        
+        ttk.Label(interval_frame, text="Extract every:").grid(row=0, column=0, sticky=tk.W, pady=5)
+        ttk.Spinbox(
+            interval_frame,
+            from_=1,
+            to=100,
+            textvariable=self.interval_var,
+            width=10
+        ).grid(row=0, column=1, padx=(10, 0), pady=5, sticky=tk.W)
+        
+        ttk.Label(interval_frame, text="frames (e.g., 2 = every 2nd frame)", foreground="gray").grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=2)
+        return interval_frame
+    
     def update_controls(self):
         """Update control visibility based on selected method."""
         method = self.selection_method_var.get()
         
-        # Show/hide frames based on method
+        # Build the selected method's controls on first use
         if method == "specific":
-            self.specific_frame.grid()
-            self.range_frame.grid_remove()
-            self.interval_frame.grid_remove()
+            self.specific_frame = self.specific_frame or self._build_specific_frame()
         elif method == "range":
-            self.specific_frame.grid_remove()
-            self.range_frame.grid()
-            self.interval_frame.grid_remove()
+            self.range_frame = self.range_frame or self._build_range_frame()
         elif method == "interval":
-            self.specific_frame.grid_remove()
-            self.range_frame.grid_remove()
-            self.interval_frame.grid()
-        else:  # all
-            self.specific_frame.grid_remove()
-            self.range_frame.grid_remove()
-            self.interval_frame.grid_remove()
+            self.interval_frame = self.interval_frame or self._build_interval_frame()
+        
+        # Show/hide frames based on method
+        for value, method_frame in (("specific", self.specific_frame),
+                                    ("range", self.range_frame),
+                                    ("interval", self.interval_frame)):
+            if method_frame is None:
+                continue
+            if value == method:
+                method_frame.grid()
+            else:
+                method_frame.grid_remove()
     
     def update_quality_label(self, value):
         """Update the quality label when scale changes."""
@@ -262,6 +294,11 @@ class ExtractFramesPanel:
             'csv_export': self.csv_export_var.get(),
         }
         
+        # Known frame count lets the app expand the method into explicit
+        # indices without reopening the GIF
+        if self._n_frames:
+            settings['frame_count'] = self._n_frames
+        
         if method == "specific":
             # Parse specific frame numbers
             frames_text = self.specific_frames_var.get()
@@ -286,25 +323,16 @@ class ExtractFramesPanel:
     
     def _parse_frame_numbers(self, frames_text: str) -> list:
         """Parse frame numbers from text input."""
-        frame_indices = []
-        parts = frames_text.split(',')
-        
-        for part in parts:
-            part = part.strip()
-            if '-' in part:
-                # Handle ranges like "1-5"
-                start, end = part.split('-', 1)
-                start, end = int(start.strip()), int(end.strip())
-                frame_indices.extend(range(start, end + 1))
-            else:
-                # Handle single numbers
-                frame_indices.append(int(part))
-        
-        # Convert to 0-based indices and remove duplicates
-        frame_indices = list(set([idx - 1 for idx in frame_indices if idx > 0]))
-        frame_indices.sort()
-        
-        return frame_indices
+        if not _FRAME_LIST_RE.fullmatch(frames_text):
+            raise ValueError(f"expected numbers or ranges like 1,5,10-15, got {frames_text!r}")
+        
+        # Convert 1-based numbers to sorted, unique 0-based indices
+        return sorted({
+            idx - 1
+            for start, end in _FRAME_RE.findall(frames_text)
+            for idx in range(int(start), int(end or start) + 1)
+            if idx > 0
+        })
     
     def process_extract_frames(self):
         """Process the extract frames operation."""
@@ -312,7 +340,12 @@ class ExtractFramesPanel:
             settings = self.get_settings()
             
             if self.on_process:
-                self.on_process('extract_frames', settings)
+                # The extraction runs on the app's processing thread; the panel
+                # is told about progress and completion on the Tk thread
+                if self.on_process('extract_frames', settings,
+                                   on_complete=self._on_extract_complete,
+                                   on_progress=self._on_extract_progress):
+                    self.start_progress()
             else:
                 messagebox.showinfo("Extract Frames", f"Extract frames settings: {settings}")
                 
@@ -321,14 +354,37 @@ class ExtractFramesPanel:
         except Exception as e:
             messagebox.showerror("Error", f"Extract frames failed: {e}")
     
+    def _on_extract_progress(self, progress: int):
+        """Called on the Tk thread with the queued extract task's progress."""
+        self._progress_queue.append(progress)
+        
+        # Redraw the bar at most every 50 ms however often workers report
+        if not self._progress_pending and self.frame.winfo_exists():
+            self._progress_pending = True
+            self.frame.after(50, self._drain_progress)
+    
+    def _drain_progress(self):
+        """Show the furthest progress reported since the last update."""
+        self._progress_pending = False
+        if self._progress_queue:
+            self.progress_var.set(max(self._progress_queue))
+            self._progress_queue.clear()
+    
+    def _on_extract_complete(self, success: bool):
+        """Called on the Tk thread when the queued extract task finishes."""
+        if self.frame.winfo_exists():
+            self.stop_progress(success)
+    
     def start_progress(self):
-        """Start the progress bar."""
-        self.progress_bar.start()
+        """Reset the progress bar and disable processing."""
+        self.progress_var.set(0)
         self.process_btn.config(state=tk.DISABLED)
     
-    def stop_progress(self):
-        """Stop the progress bar."""
-        self.progress_bar.stop()
+    def stop_progress(self, success: bool = True):
+        """Fill (or clear, on failure) the progress bar and re-enable processing."""
+        # Drop reports still waiting so a late drain cannot move the bar back
+        self._progress_queue.clear()
+        self.progress_var.set(100 if success else 0)
         self.process_btn.config(state=tk.NORMAL)
     
     def get_widget(self) -> tk.Widget:
@@ -337,10 +393,22 @@ class ExtractFramesPanel:
     
     def auto_load_gif(self, gif_path: str):
         """Auto-load GIF for frame extraction."""
-        # Store the path and update status
+        # Store the path, display name and frame count
         self.current_gif_path = gif_path
-        if hasattr(self, 'status_label'):
-            self.status_label.config(text=f"GIF loaded: {Path(gif_path).name}")
+        self._gif_name = Path(gif_path).name
+        try:
+            with Image.open(gif_path) as gif:
+                self._n_frames = getattr(gif, 'n_frames', 1)
+        except Exception:
+            self._n_frames = None
+        
+        if self._n_frames:
+            self.status_label.config(text=f"GIF loaded: {self._gif_name} ({self._n_frames} frames)")
+            if self.range_frame is not None:
+                self.range_start_spin.configure(to=self._n_frames)
+                self.range_end_spin.configure(to=self._n_frames)
+        else:
+            self.status_label.config(text=f"GIF loaded: {self._gif_name}")
     
     def set_output_directory(self, output_dir: str):
         """Set the output directory."""
@@ -7,12 +7,43 @@ GUI panel for the GIF filter effects tool with interactive controls.
 import tkinter as tk
 from tkinter import ttk, messagebox
 from pathlib import Path
-from typing import Optional, Callable, Any
-import threading
+from typing import Optional, Callable
 
-from gif_tools.core.filter_effects import apply_gif_filter, apply_gif_filters
 from gif_tools.utils.constants import FILTER_EFFECTS
 
+# Filters offered per category: display name -> filter name
+_FILTER_CATEGORIES = {
+    "basic": {
+        "Blur": "blur",
+        "Sharpen": "sharpen",
+        "Smooth": "smooth",
+        "Smooth More": "smooth_more",
+    },
+    "enhancement": {
+        "Edge Enhance": "edge_enhance",
+        "Edge Enhance More": "edge_enhance_more",
+        "Detail": "detail",
+    },
+    "artistic": {
+        "Emboss": "emboss",
+        "Find Edges": "find_edges",
+        "Contour": "contour",
+    },
+    "color": {
+        "Brightness": "brightness",
+        "Contrast": "contrast",
+        "Saturation": "saturation",
+        "Color": "color",
+    }
+}
+
+# Display name for each filter name, across all categories
+_NAME_TO_DISPLAY = {
+    filter_name: display_name
+    for filters in _FILTER_CATEGORIES.values()
+    for display_name, filter_name in filters.items()
+}
+
 
 class FilterEffectsPanel:
     """Panel for GIF filter effects operations."""
@@ -28,6 +59,23 @@ class FilterEffectsPanel:
         self.parent = parent
         self.on_process = on_process
         self.current_gif_path = None
+        
+        # Pending after() jobs for debounced label updates, by label
+        self._pending_after = {}
+        
+        # Processing mode whose controls are currently laid out, and the
+        # filter category currently listed
+        self._shown_mode = None
+        self._last_category = None
+        
+        # Filter names of the listed category, in listbox order
+        self._current_category_names = ()
+        
+        # Entries in the applied filters listbox, for duplicate checks, and
+        # the filter each row applies, in listbox order
+        self._applied_filter_set = set()
+        self._applied_filters = []
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -153,7 +201,7 @@ class FilterEffectsPanel:
         # Quality control
         ttk.Label(self.frame, text="Quality:").grid(row=6, column=0, sticky=tk.W, pady=10)
         
-        self.quality_var = tk.DoubleVar(value=85)
+        self.quality_var = tk.IntVar(value=85)
         quality_scale = ttk.Scale(
             self.frame,
             from_=1,
@@ -200,40 +248,22 @@ class FilterEffectsPanel:
     def update_filter_list(self):
         """Update the filter list based on selected category."""
         category = self.filter_category_var.get()
-        self.filter_listbox.delete(0, tk.END)
         
-        # Define filter categories
-        filter_categories = {
-            "basic": {
-                "Blur": "blur",
-                "Sharpen": "sharpen",
-                "Smooth": "smooth",
-                "Smooth More": "smooth_more",
-            },
-            "enhancement": {
-                "Edge Enhance": "edge_enhance",
-                "Edge Enhance More": "edge_enhance_more",
-                "Detail": "detail",
-            },
-            "artistic": {
-                "Emboss": "emboss",
-                "Find Edges": "find_edges",
-                "Contour": "contour",
-            },
-            "color": {
-                "Brightness": "brightness",
-                "Contrast": "contrast",
-                "Saturation": "saturation",
-                "Color": "color",
-            }
-        }
+        # Reselecting the listed category keeps the list and its selection
+        if category == self._last_category:
+            return
+        self._last_category = category
         
-        if category in filter_categories:
-            for display_name, filter_name in filter_categories[category].items():
-                self.filter_listbox.insert(tk.END, display_name)
+        filters = _FILTER_CATEGORIES.get(category, {})
+        self._current_category_names = tuple(filters.values())
+        
+        # Replace the list contents with one insert call for all names
+        self.filter_listbox.delete(0, tk.END)
+        if filters:
+            self.filter_listbox.insert(tk.END, *filters)
         
         # Select first item
-        if self.filter_listbox.size() > 0:
+        if filters:
             self.filter_listbox.selection_set(0)
             self.on_filter_select(None)
     
@@ -242,40 +272,14 @@ class FilterEffectsPanel:
         selection = self.filter_listbox.curselection()
         if selection:
             # Update filter_var based on selection
-            category = self.filter_category_var.get()
-            filter_categories = {
-                "basic": {
-                    "Blur": "blur",
-                    "Sharpen": "sharpen",
-                    "Smooth": "smooth",
-                    "Smooth More": "smooth_more",
-                },
-                "enhancement": {
-                    "Edge Enhance": "edge_enhance",
-                    "Edge Enhance More": "edge_enhance_more",
-                    "Detail": "detail",
-                },
-                "artistic": {
-                    "Emboss": "emboss",
-                    "Find Edges": "find_edges",
-                    "Contour": "contour",
-                },
-                "color": {
-                    "Brightness": "brightness",
-                    "Contrast": "contrast",
-                    "Saturation": "saturation",
-                    "Color": "color",
-                }
-            }
-            
-            if category in filter_categories:
-                filter_names = list(filter_categories[category].keys())
-                selected_filter = filter_names[selection[0]]
-                self.filter_var.set(filter_categories[category][selected_filter])
+            self.filter_var.set(self._current_category_names[selection[0]])
     
     def update_intensity_label(self, value):
-        """Update the intensity label when scale changes."""
-        intensity = float(value)
+        """Update the intensity label once the scale settles."""
+        self._debounce('intensity', self._show_intensity, float(value))
+    
+    def _show_intensity(self, intensity: float):
+        """Show an intensity value and its strength on the intensity label."""
         if intensity < 0.5:
             label = f"{intensity:.1f} (Weak)"
         elif intensity == 1.0:
@@ -288,13 +292,29 @@ class FilterEffectsPanel:
         self.intensity_label.config(text=label)
     
     def update_quality_label(self, value):
-        """Update the quality label when scale changes."""
-        self.quality_label.config(text=str(int(float(value))))
+        """Update the quality label once the scale settles."""
+        self._debounce('quality', self._show_quality)
+    
+    def _show_quality(self):
+        """Show the current quality value on the quality label."""
+        self.quality_label.config(text=str(self.quality_var.get()))
+    
+    def _debounce(self, key: str, callback: Callable, *args):
+        """Run callback(*args) once the calls for key pause for 50 ms."""
+        job = self._pending_after.get(key)
+        if job:
+            self.frame.after_cancel(job)
+        self._pending_after[key] = self.frame.after(50, callback, *args)
     
     def update_mode_controls(self):
         """Update control visibility based on processing mode."""
         mode = self.mode_var.get()
         
+        # Reselecting the current mode leaves the layout as it is
+        if mode == self._shown_mode:
+            return
+        self._shown_mode = mode
+        
         if mode == "single":
             self.multiple_frame.grid_remove()
         elif mode == "multiple":
@@ -306,51 +326,31 @@ class FilterEffectsPanel:
         intensity = self.intensity_var.get()
         
         # Get display name
-        category = self.filter_category_var.get()
-        filter_categories = {
-            "basic": {
-                "blur": "Blur",
-                "sharpen": "Sharpen",
-                "smooth": "Smooth",
-                "smooth_more": "Smooth More",
-            },
-            "enhancement": {
-                "edge_enhance": "Edge Enhance",
-                "edge_enhance_more": "Edge Enhance More",
-                "detail": "Detail",
-            },
-            "artistic": {
-                "emboss": "Emboss",
-                "find_edges": "Find Edges",
-                "contour": "Contour",
-            },
-            "color": {
-                "brightness": "Brightness",
-                "contrast": "Contrast",
-                "saturation": "Saturation",
-                "color": "Color",
-            }
-        }
-        
-        display_name = filter_categories.get(category, {}).get(filter_name, filter_name)
+        display_name = _NAME_TO_DISPLAY.get(filter_name, filter_name)
         filter_text = f"{display_name} ({intensity:.1f}x)"
         
         # Add to listbox if not already present
-        for i in range(self.applied_filters_listbox.size()):
-            if self.applied_filters_listbox.get(i) == filter_text:
-                messagebox.showinfo("Info", "Filter already added!")
-                return
+        if filter_text in self._applied_filter_set:
+            messagebox.showinfo("Info", "Filter already added!")
+            return
         
+        self._applied_filter_set.add(filter_text)
+        # Store the intensity as shown in the list
+        self._applied_filters.append({'name': filter_name, 'intensity': round(intensity, 1)})
         self.applied_filters_listbox.insert(tk.END, filter_text)
     
     def remove_selected_filter(self):
         """Remove selected filter from the applied filters list."""
         selection = self.applied_filters_listbox.curselection()
         if selection:
+            self._applied_filter_set.discard(self.applied_filters_listbox.get(selection[0]))
+            del self._applied_filters[selection[0]]
             self.applied_filters_listbox.delete(selection[0])
     
     def clear_all_filters(self):
         """Clear all applied filters."""
+        self._applied_filter_set.clear()
+        self._applied_filters.clear()
         self.applied_filters_listbox.delete(0, tk.END)
     
     def get_settings(self) -> dict:
@@ -360,7 +360,7 @@ class FilterEffectsPanel:
         
         settings = {
             'input_path': self.current_gif_path,
-            'quality': int(self.quality_var.get()),
+            'quality': self.quality_var.get(),
             'mode': self.mode_var.get(),
         }
         
@@ -370,57 +370,8 @@ class FilterEffectsPanel:
                 'intensity': self.intensity_var.get(),
             })
         else:
-            # Multiple filters mode
-            filters = []
-            for i in range(self.applied_filters_listbox.size()):
-                filter_text = self.applied_filters_listbox.get(i)
-                # Parse filter text to extract name and intensity
-                # Format: "Filter Name (intensity)"
-                if '(' in filter_text and ')' in filter_text:
-                    name_part = filter_text.split('(')[0].strip()
-                    intensity_part = filter_text.split('(')[1].split(')')[0].strip()
-                    
-                    # Convert display name back to filter name
-                    category = self.filter_category_var.get()
-                    filter_categories = {
-                        "basic": {
-                            "Blur": "blur",
-                            "Sharpen": "sharpen",
-                            "Smooth": "smooth",
-                            "Smooth More": "smooth_more",
-                        },
-                        "enhancement": {
-                            "Edge Enhance": "edge_enhance",
-                            "Edge Enhance More": "edge_enhance_more",
-                            "Detail": "detail",
-                        },
-                        "artistic": {
-                            "Emboss": "emboss",
-                            "Find Edges": "find_edges",
-                            "Contour": "contour",
-                        },
-                        "color": {
-                            "Brightness": "brightness",
-                            "Contrast": "contrast",
-                            "Saturation": "saturation",
-                            "Color": "color",
-                        }
-                    }
-                    
-                    # Find the filter name
-                    filter_name = None
-                    for cat, filters in filter_categories.items():
-                        if name_part in filters:
-                            filter_name = filters[name_part]
-                            break
-                    
-                    if filter_name:
-                        filters.append({
-                            'name': filter_name,
-                            'intensity': float(intensity_part)
-                        })
-            
-            settings['filters'] = filters
+            # Multiple filters mode: parsed when each filter was added
+            settings['filters'] = [dict(applied) for applied in self._applied_filters]
         
         return settings
     
@@ -434,7 +385,10 @@ class FilterEffectsPanel:
                 return
             
             if self.on_process:
-                self.on_process('filter_effects', settings)
+                # The filter effects run on the app's processing thread; keep the
+                # progress bar running until it reports back
+                if self.on_process('filter_effects', settings, on_complete=self._on_filter_complete):
+                    self.start_progress()
             else:
                 messagebox.showinfo("Filter Effects", f"Filter settings: {settings}")
                 
@@ -443,6 +397,11 @@ class FilterEffectsPanel:
         except Exception as e:
             messagebox.showerror("Error", f"Filter effects failed: {e}")
     
+    def _on_filter_complete(self, success: bool):
+        """Called on the Tk thread when the queued filter effects task finishes."""
+        if self.frame.winfo_exists():
+            self.stop_progress()
+    
     def start_progress(self):
         """Start the progress bar."""
         self.progress_bar.start()
@@ -461,5 +420,4 @@ class FilterEffectsPanel:
         """Auto-load GIF for filter effects."""
         # Store the path and update status
         self.current_gif_path = gif_path
-        if hasattr(self, 'status_label'):
-            self.status_label.config(text=f"GIF loaded: {Path(gif_path).name}")
+        self.status_label.config(text=f"GIF loaded: {Path(gif_path).name}")
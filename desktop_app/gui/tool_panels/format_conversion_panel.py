@@ -4,18 +4,34 @@ Format Conversion Tool Panel
 GUI panel for the GIF format conversion tool with format selection and quality controls.
 """
 
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox
 from pathlib import Path
-from typing import Optional, Callable, Any
-import threading
+from typing import Optional, Callable
 
-from gif_tools.core.format_conversion import convert_gif_format
+from PIL import Image
+
+# WebP effort label text, indexed by effort level (1-6)
+_WEBP_EFFORT_LABELS = (
+    None,
+    "1 (Fastest)",
+    "2 (Very Fast)",
+    "3 (Fast)",
+    "4 (Balanced)",
+    "5 (Slow)",
+    "6 (Slowest)",
+)
 
 
 class FormatConversionPanel:
     """Panel for GIF format conversion operations."""
     
+    # path -> ((mtime_ns, size), (format, (width, height), frame count)),
+    # shared across panels so reselecting a file skips Pillow's n_frames
+    # scan; an entry is replaced when its file changes
+    _metadata_cache = {}
+    
     def __init__(self, parent: tk.Widget, on_process: Optional[Callable] = None):
         """
         Initialize the format conversion panel.
@@ -27,6 +43,13 @@ class FormatConversionPanel:
         self.parent = parent
         self.on_process = on_process
         self.current_gif_path = None
+        
+        # Pending after() jobs for debounced label updates, by label
+        self._pending_after = {}
+        
+        # (WebP settings shown, format settings shown) as last laid out
+        self._visible_sections = None
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -75,7 +98,7 @@ class FormatConversionPanel:
         
         # Quality setting
         ttk.Label(self.settings_frame, text="Quality:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.quality_var = tk.DoubleVar(value=85)
+        self.quality_var = tk.IntVar(value=85)
         quality_scale = ttk.Scale(
             self.settings_frame,
             from_=1,
@@ -172,35 +195,50 @@ class FormatConversionPanel:
         format_type = self.target_format_var.get()
         lossless = self.lossless_var.get()
         
+        # Hide quality for lossless formats
+        visible = (format_type == "WebP", not (lossless and format_type in ["WebP", "APNG"]))
+        
+        # Only touch the grid when a section actually appears or disappears
+        if visible == self._visible_sections:
+            return
+        self._visible_sections = visible
+        
+        show_webp, show_settings = visible
+        
         # Show/hide WebP specific controls
-        if format_type == "WebP":
+        if show_webp:
             self.webp_frame.grid()
         else:
             self.webp_frame.grid_remove()
         
         # Update quality control visibility
-        if lossless and format_type in ["WebP", "APNG"]:
-            # Hide quality for lossless formats
-            self.settings_frame.grid_remove()
-        else:
+        if show_settings:
             self.settings_frame.grid()
+        else:
+            self.settings_frame.grid_remove()
     
     def update_quality_label(self, value):
-        """Update the quality label when scale changes."""
-        self.quality_label.config(text=str(int(float(value))))
+        """Update the quality label once the scale settles."""
+        self._debounce('quality', self._show_quality)
     
     def update_webp_effort_label(self, value):
-        """Update the WebP effort label when scale changes."""
-        effort = int(float(value))
-        effort_descriptions = {
-            1: "1 (Fastest)",
-            2: "2 (Very Fast)", 
-            3: "3 (Fast)",
-            4: "4 (Balanced)",
-            5: "5 (Slow)",
-            6: "6 (Slowest)"
-        }
-        self.webp_effort_label.config(text=f"{effort} ({effort_descriptions[effort]})")
+        """Update the WebP effort label once the scale settles."""
+        self._debounce('effort', self._show_webp_effort)
+    
+    def _debounce(self, key: str, callback: Callable, *args):
+        """Run callback(*args) once the calls for key pause for 50 ms."""
+        job = self._pending_after.get(key)
+        if job:
+            self.frame.after_cancel(job)
+        self._pending_after[key] = self.frame.after(50, callback, *args)
+    
+    def _show_quality(self):
+        """Show the current quality value on the quality label."""
+        self.quality_label.config(text=str(self.quality_var.get()))
+    
+    def _show_webp_effort(self):
+        """Show the current effort level and its description on the WebP effort label."""
+        self.webp_effort_label.config(text=_WEBP_EFFORT_LABELS[self.webp_effort_var.get()])
     
     def get_settings(self) -> dict:
         """Get current format conversion settings."""
@@ -213,7 +251,7 @@ class FormatConversionPanel:
         settings = {
             'input_path': self.current_gif_path,
             'target_format': format_type,
-            'quality': int(self.quality_var.get()) if not lossless else 100,
+            'quality': self.quality_var.get() if not lossless else 100,
             'lossless': lossless,
         }
         
@@ -221,7 +259,7 @@ class FormatConversionPanel:
         if format_type == "WebP":
             settings.update({
                 'method': self.webp_method_var.get(),
-                'effort': int(self.webp_effort_var.get()),
+                'effort': self.webp_effort_var.get(),
             })
         
         return settings
@@ -232,7 +270,10 @@ class FormatConversionPanel:
             settings = self.get_settings()
             
             if self.on_process:
-                self.on_process('format_conversion', settings)
+                # The conversion runs on the app's processing thread; keep the
+                # progress bar running until it reports back
+                if self.on_process('format_conversion', settings, on_complete=self._on_conversion_complete):
+                    self.start_progress()
             else:
                 messagebox.showinfo("Format Conversion", f"Format conversion settings: {settings}")
                 
@@ -241,6 +282,11 @@ class FormatConversionPanel:
         except Exception as e:
             messagebox.showerror("Error", f"Format conversion failed: {e}")
     
+    def _on_conversion_complete(self, success: bool):
+        """Called on the Tk thread when the queued format conversion task finishes."""
+        if self.frame.winfo_exists():
+            self.stop_progress()
+    
     def start_progress(self):
         """Start the progress bar."""
         self.progress_bar.start()
@@ -259,23 +305,31 @@ class FormatConversionPanel:
         """Auto-load GIF for format conversion."""
         # Store the path and update status
         self.current_gif_path = gif_path
-        if hasattr(self, 'status_label'):
-            self.status_label.config(text=f"GIF loaded: {Path(gif_path).name}")
+        self.status_label.config(text=f"GIF loaded: {Path(gif_path).name}")
         
         # Try to read current format info from GIF
         try:
-            from PIL import Image
-            with Image.open(gif_path) as gif:
-                format_info = gif.format
-                size_info = f"{gif.size[0]}x{gif.size[1]}"
-                frame_count = getattr(gif, 'n_frames', 1)
-                
-                format_text = f"Current: {format_info} format, {size_info}, {frame_count} frames"
-                
-                if hasattr(self, 'current_format_label'):
-                    self.current_format_label.config(text=format_text)
-                    
+            format_info, size, frame_count = self._read_metadata(gif_path)
         except Exception:
             # If we can't read the format info, just show that it's loaded
-            if hasattr(self, 'current_format_label'):
-                self.current_format_label.config(text="GIF loaded (format info unavailable)")
+            self.current_format_label.config(text="GIF loaded (format info unavailable)")
+            return
+        
+        size_info = f"{size[0]}x{size[1]}"
+        format_text = f"Current: {format_info} format, {size_info}, {frame_count} frames"
+        self.current_format_label.config(text=format_text)
+    
+    def _read_metadata(self, gif_path: str) -> tuple:
+        """Return (format, size, frame count) for a GIF, cached until the file changes."""
+        stat = os.stat(gif_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._metadata_cache.get(gif_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        with Image.open(gif_path) as gif:
+            metadata = (gif.format, gif.size, getattr(gif, 'n_frames', 1))
+        self._metadata_cache[gif_path] = (signature, metadata)
+        
+        return metadata
@@ -5,13 +5,125 @@ Free Play Panel for layering GIFs with click-to-place functionality.
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from PIL import Image, ImageTk
+import collections
+import collections.abc
 import os
+import queue
+import threading
+import time
 from pathlib import Path
 
+# Pixel memory for rendered preview frames kept for replay (one
+# PhotoImage per frame, 4 bytes per pixel in Tk)
+_PHOTO_CACHE_BUDGET = 64 * 1024 * 1024
+
+# Decoded frame memory kept for reloading or layering the same file again
+_DECODE_CACHE_BUDGET = 256 * 1024 * 1024
+
+# Preview frame time at 1x speed; matches the 100 ms the exporter writes
+_PLAY_FRAME_SECONDS = 0.1
+
+# Decoded size past which a GIF's frames are decoded on demand
+_DECODED_FRAMES_BUDGET = 256 * 1024 * 1024
+
+# Frames kept decoded for each GIF that is decoded on demand
+_LAZY_FRAME_CACHE_SIZE = 32
+
+
+def _clip_placement(position, box, canvas_size):
+    """
+    Clip a box of a layer frame placed at position to the canvas.
+    
+    Returns (dest, source) for Image.alpha_composite, or None when the
+    box lies entirely outside the canvas.
+    """
+    x, y = position
+    box_left, box_top, box_right, box_bottom = box
+    canvas_width, canvas_height = canvas_size
+    
+    left, top = max(x + box_left, 0), max(y + box_top, 0)
+    right, bottom = min(x + box_right, canvas_width), min(y + box_bottom, canvas_height)
+    if left >= right or top >= bottom:
+        return None
+    
+    return (left, top), (left - x, top - y, right - x, bottom - y)
+
+
+class _LazyFrames(collections.abc.Sequence):
+    """
+    Frames of a large GIF, decoded on demand.
+    
+    Only the most recently used frames are kept, so memory does not grow
+    with the frame count. The file stays open until close().
+    
+    GIF frames only decode in order: reading an index before the last one
+    decoded makes Pillow decode again from frame 0. Each layer therefore
+    gets its own sequence (see fork()), so layers of one file with
+    different start frames do not pull each other's read position back.
+    Playback and export then read forward, with one restart from frame 0
+    each time the animation loops.
+    """
+    
+    def __init__(self, file_path, opaque):
+        self.file_path = file_path
+        self._opaque = opaque  # Per frame: stored as RGB rather than RGBA
+        self._gif = Image.open(file_path)
+        self._frames = collections.OrderedDict()
+        
+        # Guards the file and decoded frames: the Tk thread reads frames
+        # while a loader thread may close the sequence on cache eviction
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self._opaque)
+    
+    def __getitem__(self, index):
+        if not 0 <= index < len(self._opaque):
+            raise IndexError("frame index out of range")
+        
+        with self._lock:
+            frame = self._frames.get(index)
+            if frame is not None:
+                self._frames.move_to_end(index)
+                return frame
+            
+            if self._gif is None:
+                self._gif = Image.open(self.file_path)
+            self._gif.seek(index)
+            frame = self._gif.convert('RGBA')
+            if self._opaque[index]:
+                frame = frame.convert('RGB')
+            
+            self._frames[index] = frame
+            if len(self._frames) > _LAZY_FRAME_CACHE_SIZE:
+                self._frames.popitem(last=False)
+            
+            return frame
+    
+    def fork(self):
+        """Get a sequence over the same file with its own read position and frames."""
+        return _LazyFrames(self.file_path, self._opaque)
+    
+    def close(self):
+        """Close the file and drop decoded frames; later access reopens it."""
+        with self._lock:
+            if self._gif is not None:
+                self._gif.close()
+                self._gif = None
+            self._frames.clear()
+
 
 class FreePlayPanel:
     """Panel for layering GIFs with click-to-place functionality."""
     
+    # (path, mtime_ns, size) -> ((frames, durations, bboxes, is_animated),
+    # decoded bytes), least recently used first; shared by every open Free
+    # Play panel and the loader threads, and cleared when the last closes
+    _decode_cache = collections.OrderedDict()
+    _decode_cache_bytes = 0
+    _decode_lock = threading.Lock()
+    _open_panels = 0
+    
     def __init__(self, parent, on_process):
         self.parent = parent
         self.on_process = on_process
@@ -22,14 +134,50 @@ class FreePlayPanel:
         self.preview_frames = []
         self.current_frame = 0
         self.is_playing = False
+        self._play_after = None
+        self._next_tick = 0.0
+        
+        # Rendered preview frames by canvas size and what each layer shows
+        # (asset, position, frame index), so any arrangement seen before,
+        # e.g. after moving a layer back, is reused without compositing
+        self._photo_cache = collections.OrderedDict()
+        
+        # Evicted PhotoImages, repainted by later renders instead of
+        # allocating new Tk images
+        self._spare_photos = []
+        
+        # Set while a coalesced redraw is waiting for the event loop to idle
+        self._redraw_pending = False
+        
+        # Pending idle callback that renders upcoming frames ahead of time
+        self._prerender_after = None
+        
+        # Decoded GIFs used by the layers, by file_key(); layers of the same
+        # file share one entry, so memory grows with files, not layers
+        self._assets = {}
+        
+        # Results of the background GIF loader, drained on the Tk thread by
+        # a polling after() callback; the event tells the loader to stop
+        # once the panel is destroyed
+        self._load_queue = queue.Queue()
+        self._loaded_count = 0
+        self._drain_after = None
+        self._load_cancel = threading.Event()
         
         # Canvas dimensions (will be updated by controls)
         self.canvas_width = 600
         self.canvas_height = 400
         
+        # On-screen size of the preview canvas; 1x1 until it is first laid out
+        self._widget_width = 1
+        self._widget_height = 1
+        
         self.setup_ui()
         # Initialize canvas size
         self.update_canvas_size()
+        
+        FreePlayPanel._open_panels += 1
+        self.main_container.bind('<Destroy>', self.on_destroy)
     
     def setup_ui(self):
         """Set up the user interface."""
@@ -52,11 +200,12 @@ class FreePlayPanel:
         row = 0
         
         # Load GIFs button
-        ttk.Button(
+        self.load_btn = ttk.Button(
             self.controls_frame, 
             text="Load GIFs", 
             command=self.load_gifs
-        ).grid(row=row, column=0, columnspan=2, pady=5, sticky=tk.W+tk.E)
+        )
+        self.load_btn.grid(row=row, column=0, columnspan=2, pady=5, sticky=tk.W+tk.E)
         row += 1
         
         # Selected GIFs info
@@ -251,10 +400,20 @@ class FreePlayPanel:
             self.preview_frame, 
             width=self.canvas_width, 
             height=self.canvas_height,
-            bg='black'
+            bg='black',
+            highlightthickness=0
         )
         self.preview_canvas.pack(fill=tk.NONE, expand=False, pady=(0, 10))
         self.preview_canvas.bind('<Button-1>', self.on_canvas_click)
+        self.preview_canvas.bind('<Configure>', self.on_canvas_configure)
+        
+        # Single image item; rendered frames are swapped into it
+        self._canvas_image = self.preview_canvas.create_image(
+            self.canvas_width // 2,
+            self.canvas_height // 2,
+            anchor=tk.CENTER
+        )
+        self.preview_canvas.image = None  # PhotoImage shown by the item
         
         # Instructions for canvas
         self.canvas_instructions = ttk.Label(
@@ -326,48 +485,240 @@ class FreePlayPanel:
         if not file_paths:
             return
         
-        loaded_count = 0
+        # Decode on a worker thread so the window stays responsive
+        self.load_btn.config(state='disabled')
+        self.start_progress()
+        self.status_label.config(text=f"Loading {len(file_paths)} GIF(s)...")
+        
+        self._loaded_count = 0
+        threading.Thread(
+            target=self._load_gifs_worker,
+            args=(file_paths, self._load_queue),
+            daemon=True
+        ).start()
+        self._drain_after = self.parent.after(50, self._drain_load_queue)
+    
+    def _load_gifs_worker(self, file_paths, load_queue):
+        """Decode GIFs in the background and queue the results for the UI."""
         for file_path in file_paths:
+            if self._load_cancel.is_set():
+                return
             try:
-                # Load GIF
-                gif = Image.open(file_path)
-                
-                # Extract frames
-                frames = []
-                durations = []
-                
-                if gif.is_animated:
-                    for frame_idx in range(gif.n_frames):
-                        gif.seek(frame_idx)
-                        frames.append(gif.copy().convert('RGBA'))
-                        durations.append(gif.info.get('duration', 100))
-                else:
-                    frames.append(gif.copy().convert('RGBA'))
-                    durations.append(100)
+                # Reuse the frames of a layer already showing this file;
+                # otherwise decode (cached across panels)
+                key = self.file_key(file_path)
+                decoded = self._assets.get(key)
+                if decoded is None:
+                    decoded = self.decode_gif(file_path)
+                    if self._load_cancel.is_set():
+                        # The panel closed while decoding; if it was the
+                        # last one, drop what this decode cached again
+                        if FreePlayPanel._open_panels == 0:
+                            FreePlayPanel.clear_decode_cache()
+                        return
+                load_queue.put(('loaded', (file_path, key, decoded)))
+            except Exception as e:
+                load_queue.put(('error', (file_path, str(e))))
+        load_queue.put(('done', None))
+    
+    def _drain_load_queue(self):
+        """Add layers decoded by the worker; reschedule until it is done."""
+        self._drain_after = None
+        while True:
+            try:
+                kind, payload = self._load_queue.get_nowait()
+            except queue.Empty:
+                self._drain_after = self.parent.after(50, self._drain_load_queue)
+                return
+            
+            if kind == 'loaded':
+                file_path, key, decoded = payload
+                frames, durations, bboxes, is_animated = self._assets.setdefault(key, decoded)
+                if isinstance(frames, _LazyFrames):
+                    # On-demand frames get a per-layer read position
+                    frames = frames.fork()
                 
                 # Add to layers (initially at position 0,0)
                 layer = {
                     'file_path': file_path,
+                    'asset_key': key,
                     'position': (0, 0),
                     'frames': frames,
                     'durations': durations,
-                    'is_animated': gif.is_animated,
+                    'bboxes': bboxes,
+                    'is_animated': is_animated,
                     'frame_start': 0
                 }
+                self.update_placements(layer)
                 
                 self.gif_layers.append(layer)
-                loaded_count += 1
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load {file_path}: {e}")
+                self.layers_listbox.insert(tk.END, self.layer_label(len(self.gif_layers) - 1))
+                self._loaded_count += 1
+            elif kind == 'error':
+                file_path, error = payload
+                messagebox.showerror("Error", f"Failed to load {file_path}: {error}")
+            else:
+                break
+        
+        self.stop_progress()
+        self.load_btn.config(state='normal')
         
+        loaded_count = self._loaded_count
         if loaded_count > 0:
             # Update UI
-            self.update_layers_list()
             self.update_selected_gifs_label()
             self.update_frame_controls()
-            self.display_preview_frame()
+            self.request_redraw()
             self.status_label.config(text=f"Loaded {loaded_count} GIF(s). Select a layer to place it.")
+        else:
+            self.status_label.config(text="No GIFs loaded")
+    
+    @staticmethod
+    def file_key(file_path):
+        """Identify a file's current contents by (path, mtime_ns, size)."""
+        stat = os.stat(file_path)
+        return (file_path, stat.st_mtime_ns, stat.st_size)
+    
+    def release_assets(self):
+        """Drop decoded assets that no layer uses any more."""
+        in_use = {layer['asset_key'] for layer in self.gif_layers}
+        for key in list(self._assets):
+            if key not in in_use:
+                del self._assets[key]
+    
+    @classmethod
+    def decode_gif(cls, file_path):
+        """
+        Decode a GIF into frames, durations and visible boxes.
+        
+        Frames are RGBA, or RGB when they have no transparent pixels. GIFs
+        too large to keep decoded get a _LazyFrames sequence instead of a
+        list.
+        
+        Results are cached until the file changes; layers of the same file
+        share one set of frames.
+        
+        Returns:
+            Tuple of (frames, durations, bboxes, is_animated)
+        """
+        key = cls.file_key(file_path)
+        with cls._decode_lock:
+            entry = cls._decode_cache.get(key)
+            if entry is not None:
+                cls._decode_cache.move_to_end(key)
+                return entry[0]
+        
+        with Image.open(file_path) as gif:
+            # Extract frames by seeking until the end; asking for n_frames
+            # up front would scan the whole file once more
+            frames = []
+            durations = []
+            bboxes = []
+            opaque = []
+            decoded_bytes = 0
+            frame_idx = 0
+            try:
+                while True:
+                    gif.seek(frame_idx)
+                    # convert() returns a new image, so no copy() is needed;
+                    # the decoder's buffer is only replaced by the next seek()
+                    frame = gif.convert('RGBA')
+                    durations.append(gif.info.get('duration', 100))
+                    
+                    # Visible (non-transparent) box of the frame; the
+                    # preview only blends these pixels
+                    bboxes.append(frame.getbbox())
+                    
+                    # Frames without any transparency are kept as RGB, a
+                    # quarter less memory, and are pasted instead of blended
+                    opaque.append(frame.getextrema()[3][0] == 255)
+                    
+                    # Past the memory budget, stop keeping frames and decode
+                    # them on demand instead
+                    if frames is not None:
+                        frames.append(frame.convert('RGB') if opaque[-1] else frame)
+                        decoded_bytes += frame.width * frame.height * 4
+                        if decoded_bytes > _DECODED_FRAMES_BUDGET:
+                            frames = None
+                    frame_idx += 1
+            except EOFError:
+                pass
+        
+        if frames is None:
+            frames = _LazyFrames(file_path, opaque)
+            decoded_bytes = min(len(opaque), _LAZY_FRAME_CACHE_SIZE) * frame.width * frame.height * 4
+        
+        is_animated = len(frames) > 1
+        if not is_animated:
+            durations = [100]
+        
+        decoded = (frames, durations, bboxes, is_animated)
+        cls._cache_decoded(key, decoded, decoded_bytes)
+        
+        return decoded
+    
+    @classmethod
+    def _cache_decoded(cls, key, decoded, decoded_bytes):
+        """Add a decoded GIF to the cache, evicting the oldest past the budget."""
+        with cls._decode_lock:
+            # Replace an entry another loader added meanwhile
+            old = cls._decode_cache.pop(key, None)
+            if old is not None:
+                cls._decode_cache_bytes -= old[1]
+            
+            cls._decode_cache[key] = (decoded, decoded_bytes)
+            cls._decode_cache_bytes += decoded_bytes
+            
+            # The newest entry stays even when it alone is over budget
+            while cls._decode_cache_bytes > _DECODE_CACHE_BUDGET and len(cls._decode_cache) > 1:
+                _, (evicted, evicted_bytes) = cls._decode_cache.popitem(last=False)
+                cls._decode_cache_bytes -= evicted_bytes
+                cls._close_decoded(evicted)
+    
+    @classmethod
+    def clear_decode_cache(cls):
+        """Drop every cached decoded GIF and close on-demand files."""
+        with cls._decode_lock:
+            for decoded, _ in cls._decode_cache.values():
+                cls._close_decoded(decoded)
+            cls._decode_cache.clear()
+            cls._decode_cache_bytes = 0
+    
+    @staticmethod
+    def _close_decoded(decoded):
+        """Close the file behind on-demand frames; layers still using them reopen it."""
+        frames = decoded[0]
+        if isinstance(frames, _LazyFrames):
+            frames.close()
+    
+    @staticmethod
+    def close_layer_frames(layers):
+        """Close the files held open by on-demand frames of the given layers."""
+        for layer in layers:
+            if isinstance(layer['frames'], _LazyFrames):
+                layer['frames'].close()
+    
+    def on_destroy(self, event):
+        """Stop scheduled work and free shared caches once no panel is open."""
+        if event.widget is not self.main_container:
+            return
+        
+        self.is_playing = False
+        self._load_cancel.set()
+        for after_id in (self._play_after, self._prerender_after, self._drain_after):
+            if after_id is not None:
+                try:
+                    self.parent.after_cancel(after_id)
+                except tk.TclError:
+                    pass
+        self._play_after = self._prerender_after = self._drain_after = None
+        
+        # Release files held open by this panel's on-demand layers
+        self.close_layer_frames(self.gif_layers)
+        
+        FreePlayPanel._open_panels -= 1
+        if FreePlayPanel._open_panels == 0:
+            FreePlayPanel.clear_decode_cache()
     
     def on_canvas_click(self, event):
         """Handle canvas click to place/move selected layers."""
@@ -380,9 +731,9 @@ class FreePlayPanel:
         x, y = event.x, event.y
         
         # Convert canvas coordinates to GIF coordinates
-        # Get actual canvas widget size
-        widget_width = self.preview_canvas.winfo_width()
-        widget_height = self.preview_canvas.winfo_height()
+        # Get actual canvas widget size (tracked by on_canvas_configure)
+        widget_width = self._widget_width
+        widget_height = self._widget_height
         
         if widget_width <= 1 or widget_height <= 1:
             return
@@ -409,26 +760,39 @@ class FreePlayPanel:
             
             # Update layer position
             layer['position'] = (final_x, final_y)
+            self.update_placements(layer)
             moved_count += 1
         
         # Update layers list
-        self.update_layers_list()
+        self.update_layers_list(selection)
         
         # Update preview
-        self.display_preview_frame()
+        self.request_redraw()
         
         # Update status
         self.status_label.config(text=f"Moved {moved_count} layer(s) to ({gif_x}, {gif_y}) - {positioning_mode}")
     
-    def update_layers_list(self):
-        """Update the layers listbox."""
-        self.layers_listbox.delete(0, tk.END)
-        
-        for i, layer in enumerate(self.gif_layers):
-            filename = os.path.basename(layer['file_path'])
-            x, y = layer['position']
-            frame_start = layer.get('frame_start', 0)
-            self.layers_listbox.insert(tk.END, f"{i+1}. {filename} at ({x}, {y}) start:{frame_start}")
+    def layer_label(self, index):
+        """Get the layers listbox text for the layer at index."""
+        layer = self.gif_layers[index]
+        filename = os.path.basename(layer['file_path'])
+        x, y = layer['position']
+        frame_start = layer.get('frame_start', 0)
+        return f"{index+1}. {filename} at ({x}, {y}) start:{frame_start}"
+    
+    def on_canvas_configure(self, event):
+        """Track the preview canvas widget size as Tk lays it out."""
+        self._widget_width = event.width
+        self._widget_height = event.height
+    
+    def update_layers_list(self, indices):
+        """Rewrite the listbox rows of the given layers, keeping their selection."""
+        for i in indices:
+            selected = self.layers_listbox.selection_includes(i)
+            self.layers_listbox.delete(i)
+            self.layers_listbox.insert(i, self.layer_label(i))
+            if selected:
+                self.layers_listbox.selection_set(i)
     
     def on_layer_select(self, event):
         """Handle layer selection."""
@@ -440,7 +804,7 @@ class FreePlayPanel:
             self.frame_start_var.set(layer.get('frame_start', 0))
             self.update_selected_layer_label()
             self.update_frame_info(layer)
-            self.display_preview_frame()
+            self.request_redraw()
         else:
             # Don't clear selection when clicking on canvas
             pass
@@ -456,10 +820,10 @@ class FreePlayPanel:
             self.selected_layer_index -= 1
             
             # Update UI
-            self.update_layers_list()
+            self.update_layers_list((self.selected_layer_index, self.selected_layer_index + 1))
             self.layers_listbox.selection_clear(0, tk.END)
             self.layers_listbox.selection_set(self.selected_layer_index)
-            self.display_preview_frame()
+            self.request_redraw()
             self.status_label.config(text="Layer moved up")
     
     def move_layer_down(self):
@@ -473,30 +837,38 @@ class FreePlayPanel:
             self.selected_layer_index += 1
             
             # Update UI
-            self.update_layers_list()
+            self.update_layers_list((self.selected_layer_index - 1, self.selected_layer_index))
             self.layers_listbox.selection_clear(0, tk.END)
             self.layers_listbox.selection_set(self.selected_layer_index)
-            self.display_preview_frame()
+            self.request_redraw()
             self.status_label.config(text="Layer moved down")
     
     def remove_selected_layer(self):
         """Remove selected layer."""
         if self.selected_layer_index != -1:
-            del self.gif_layers[self.selected_layer_index]
+            index = self.selected_layer_index
+            self.close_layer_frames(self.gif_layers[index:index + 1])
+            del self.gif_layers[index]
             self.selected_layer_index = -1
-            self.update_layers_list()
+            self.release_assets()
+            
+            # Drop its row; only the rows below it are renumbered
+            self.layers_listbox.delete(index)
+            self.update_layers_list(range(index, len(self.gif_layers)))
             self.update_selected_layer_label()
-            self.display_preview_frame()
+            self.request_redraw()
             self.status_label.config(text="Layer removed")
     
     def clear_all_layers(self):
         """Clear all layers."""
+        self.close_layer_frames(self.gif_layers)
         self.gif_layers.clear()
         self.selected_layer_index = -1
-        self.update_layers_list()
+        self.release_assets()
+        self.layers_listbox.delete(0, tk.END)
         self.update_selected_layer_label()
         self.update_frame_info(None)
-        self.display_preview_frame()
+        self.request_redraw()
         self.status_label.config(text="All layers cleared")
     
     def select_all_layers(self):
@@ -604,6 +976,11 @@ class FreePlayPanel:
             new_width = self.canvas_width_var.get()
             new_height = self.canvas_height_var.get()
             
+            # Focus-out, Return and the variable traces all land here; keep
+            # the rendered frames unless the size actually changed
+            if (new_width, new_height) == (self.canvas_width, self.canvas_height):
+                return
+            
             print(f"Canvas size changed to: {new_width}x{new_height}")  # Debug
             
             # Validate dimensions
@@ -615,22 +992,21 @@ class FreePlayPanel:
             self.canvas_width = new_width
             self.canvas_height = new_height
             
-            # Destroy and recreate the canvas with new size
-            self.preview_canvas.destroy()
+            # Re-clip layer placements to the new canvas
+            for layer in self.gif_layers:
+                self.update_placements(layer)
             
-            # Create new canvas with correct size
-            self.preview_canvas = tk.Canvas(
-                self.preview_frame,
-                width=new_width,
-                height=new_height,
-                bg='black',
-                highlightthickness=0
-            )
-            self.preview_canvas.pack(pady=10, fill=tk.NONE, expand=False)
-            self.preview_canvas.bind('<Button-1>', self.on_canvas_click)
+            # Frames rendered at the old size can neither be shown nor
+            # repainted at the new one
+            self._photo_cache.clear()
+            self._spare_photos.clear()
+            
+            # Resize the canvas in place and re-center its image item
+            self.preview_canvas.config(width=new_width, height=new_height)
+            self.preview_canvas.coords(self._canvas_image, new_width // 2, new_height // 2)
             
             # Update the preview frame
-            self.display_preview_frame()
+            self.request_redraw()
             
             # Update status
             self.status_label.config(text=f"Canvas size: {new_width}x{new_height}")
@@ -664,13 +1040,13 @@ class FreePlayPanel:
         layer['frame_start'] = frame_start
         
         # Update layers list
-        self.update_layers_list()
+        self.update_layers_list((self.selected_layer_index,))
         
         # Update frame info
         self.update_frame_info(layer)
         
         # Update preview
-        self.display_preview_frame()
+        self.request_redraw()
         
         # Update status
         filename = os.path.basename(layer['file_path'])
@@ -680,64 +1056,191 @@ class FreePlayPanel:
         """Update quality label."""
         self.quality_label.config(text=str(int(float(value))))
     
+    def update_placements(self, layer):
+        """
+        Clip every frame of a layer to the canvas at the layer's position.
+        
+        Stores one (dest, source) pair per frame, or None for frames with
+        nothing visible on the canvas, so compositing needs no bounds math.
+        """
+        canvas_size = (self.canvas_width, self.canvas_height)
+        position = layer['position']
+        layer['placements'] = [
+            bbox and _clip_placement(position, bbox, canvas_size)
+            for bbox in layer['bboxes']
+        ]
+    
+    def request_redraw(self):
+        """Schedule one preview redraw for when the event loop goes idle."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.parent.after_idle(self._do_redraw)
+    
+    def _do_redraw(self):
+        """Run the redraw scheduled by request_redraw."""
+        self._redraw_pending = False
+        self.display_preview_frame()
+        self.schedule_prerender()
+    
+    def schedule_prerender(self):
+        """Render the frames after the current one while the UI is idle."""
+        if self._prerender_after is not None:
+            self.parent.after_cancel(self._prerender_after)
+            self._prerender_after = None
+        
+        if not self.gif_layers:
+            return
+        
+        # Stay below the cache size so the frame on screen is not evicted
+        max_frames = max(len(layer['frames']) for layer in self.gif_layers)
+        count = min(max_frames, self.photo_cache_limit()) - 1
+        if count > 0:
+            self._prerender_after = self.parent.after_idle(
+                self._prerender_step, self.current_frame + 1, count
+            )
+    
+    def _prerender_step(self, frame_number, remaining):
+        """Render one upcoming frame, then yield to the event loop."""
+        self._prerender_after = None
+        if not self.gif_layers:
+            return
+        
+        max_frames = max(len(layer['frames']) for layer in self.gif_layers)
+        try:
+            self.frame_photo(frame_number % max_frames)
+        except Exception as e:
+            print(f"Prerender error: {e}")
+            return
+        
+        if remaining > 1:
+            self._prerender_after = self.parent.after_idle(
+                self._prerender_step, frame_number + 1, remaining - 1
+            )
+    
     def display_preview_frame(self):
         """Display the current preview frame with all layers."""
         if not self.gif_layers:
             return
         
         try:
-            # Use custom canvas size
-            base_frame = Image.new('RGBA', (self.canvas_width, self.canvas_height), (0, 0, 0, 0))
-            
-            # Add each layer in order
-            for layer in self.gif_layers:
-                if layer['is_animated']:
-                    # Calculate frame index with frame start offset
-                    frame_index = (self.current_frame + layer['frame_start']) % len(layer['frames'])
-                    layer_frame = layer['frames'][frame_index]
-                else:
-                    layer_frame = layer['frames'][0]
-                
-                # Paste layer at its position
-                x, y = layer['position']
-                if layer_frame.mode == 'RGBA':
-                    base_frame.paste(layer_frame, (x, y), layer_frame)
-                else:
-                    base_frame.paste(layer_frame, (x, y))
-            
-            # Display composite
-            self.display_frame_on_canvas(base_frame)
-                
+            photo = self.frame_photo(self.current_frame)
         except Exception as e:
             print(f"Display error: {e}")
+            return
+        
+        self.display_frame_on_canvas(photo)
     
-    def display_frame_on_canvas(self, frame):
-        """Display a frame on the canvas."""
+    def photo_cache_limit(self):
+        """Get how many canvas-sized PhotoImages fit the cache budget (at least 2)."""
+        frame_bytes = self.canvas_width * self.canvas_height * 4
+        return max(2, _PHOTO_CACHE_BUDGET // frame_bytes)
+    
+    def frame_photo(self, frame_number):
+        """Get the PhotoImage of a preview frame, rendering it on a cache miss."""
+        # Replays of a frame reuse the PhotoImage rendered for it
+        layer_frames = self.layer_frames_at(frame_number)
+        key = (self.canvas_width, self.canvas_height) + tuple(
+            (layer['asset_key'], layer['position'], frame_index)
+            for layer, frame_index in layer_frames
+        )
+        photo = self._photo_cache.get(key)
+        if photo is None:
+            # The composite is built at canvas size, so it is shown as is
+            photo = self.render_photo(self.composite_frame(layer_frames))
+            
+            self._photo_cache[key] = photo
+            if len(self._photo_cache) > self.photo_cache_limit():
+                self._spare_photos.append(self._photo_cache.popitem(last=False)[1])
+        else:
+            self._photo_cache.move_to_end(key)
+        
+        return photo
+    
+    def render_photo(self, image):
+        """Get a PhotoImage of image, repainting a spare one when it fits."""
+        if self._spare_photos:
+            photo = self._spare_photos.pop()
+            if (photo.width(), photo.height()) == image.size:
+                photo.paste(image)
+                return photo
+        
+        return ImageTk.PhotoImage(image)
+    
+    def layer_frames_at(self, frame_number):
+        """Get (layer, frame index) for every layer at a preview frame, bottom to top."""
+        layer_frames = []
+        for layer in self.gif_layers:
+            if layer['is_animated']:
+                # Calculate frame index with frame start offset
+                frame_index = (frame_number + layer['frame_start']) % len(layer['frames'])
+            else:
+                frame_index = 0
+            layer_frames.append((layer, frame_index))
+        
+        return layer_frames
+    
+    def composite_frame(self, layer_frames):
+        """
+        Composite (layer, frame index) pairs onto a canvas-sized image.
+        
+        The result may be a layer's own frame, so it must not be modified.
+        """
+        canvas_size = (self.canvas_width, self.canvas_height)
+        
+        # Layers under an opaque frame that fills the canvas cannot show
+        # through it; start from the topmost such frame
+        for start in range(len(layer_frames) - 1, 0, -1):
+            layer, frame_index = layer_frames[start]
+            if self.fills_canvas(layer, layer['frames'][frame_index]):
+                layer_frames = layer_frames[start:]
+                break
+        
+        # A lone frame exactly covering the canvas is the composite itself
+        if len(layer_frames) == 1:
+            layer, frame_index = layer_frames[0]
+            layer_frame = layer['frames'][frame_index]
+            if layer['position'] == (0, 0) and layer_frame.size == canvas_size:
+                return layer_frame
+        
+        # Use custom canvas size
+        base_frame = Image.new('RGBA', canvas_size, (0, 0, 0, 0))
+        
+        # Add each layer in order
+        for i, (layer, frame_index) in enumerate(layer_frames):
+            layer_frame = layer['frames'][frame_index]
+            
+            # Blend the visible, on-canvas part of the layer over what is below it
+            if layer_frame.mode == 'RGBA' and i > 0:
+                placement = layer['placements'][frame_index]
+                if placement:
+                    dest, source = placement
+                    base_frame.alpha_composite(layer_frame, dest, source)
+            else:
+                # Opaque frames, and the bottom frame (there is nothing
+                # below it yet), are copied in without blending
+                base_frame.paste(layer_frame, layer['position'])
+        
+        return base_frame
+    
+    def fills_canvas(self, layer, frame):
+        """Check whether an opaque (RGB) layer frame covers the whole canvas."""
+        if frame.mode != 'RGB':
+            return False
+        
+        x, y = layer['position']
+        return (x <= 0 and y <= 0 and
+                x + frame.width >= self.canvas_width and
+                y + frame.height >= self.canvas_height)
+    
+    def display_frame_on_canvas(self, photo):
+        """Display a rendered frame on the canvas."""
+        # Already shown; a PhotoImage repainted in place updates by itself
+        if photo is self.preview_canvas.image:
+            return
+        
         try:
-            # Convert PIL image to PhotoImage
-            photo = ImageTk.PhotoImage(frame)
-            
-            # Use configured canvas size instead of widget size
-            canvas_width = self.canvas_width
-            canvas_height = self.canvas_height
-            
-            # Calculate scale to fit
-            scale = min(canvas_width / frame.width, canvas_height / frame.height)
-            new_width = int(frame.width * scale)
-            new_height = int(frame.height * scale)
-            
-            # Resize frame
-            resized = frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(resized)
-            
-            # Clear canvas and display
-            self.preview_canvas.delete("all")
-            self.preview_canvas.create_image(
-                canvas_width // 2, 
-                canvas_height // 2, 
-                image=photo, 
-                anchor=tk.CENTER
-            )
+            # Swap the frame into the existing image item
+            self.preview_canvas.itemconfig(self._canvas_image, image=photo)
             
             # Keep reference to prevent garbage collection
             self.preview_canvas.image = photo
@@ -754,13 +1257,18 @@ class FreePlayPanel:
         
         if self.is_playing:
             self.play_btn.config(text="⏸")
+            self._next_tick = time.monotonic()
             self.start_play_loop()
         else:
             self.play_btn.config(text="▶")
+            if self._play_after is not None:
+                self.parent.after_cancel(self._play_after)
+                self._play_after = None
     
     def start_play_loop(self):
         """Start the play loop."""
         if self.is_playing and self.gif_layers:
+            # Already paced by after(); draw directly
             self.display_preview_frame()
             
             # Find the maximum number of frames
@@ -771,9 +1279,16 @@ class FreePlayPanel:
             self.frame_var.set(str(self.current_frame))
             self.frame_scale.set(self.current_frame)
             
-            # Schedule next frame
-            delay = int(1000 / (self.speed_var.get() * 10))
-            self.parent.after(delay, self.start_play_loop)
+            # Schedule next frame against the clock so render time does not
+            # stretch the frame interval
+            now = time.monotonic()
+            self._next_tick += _PLAY_FRAME_SECONDS / self.speed_var.get()
+            if self._next_tick < now:
+                # Rendering fell behind; restart the cadence instead of
+                # firing a burst of catch-up frames
+                self._next_tick = now
+            delay = max(1, int((self._next_tick - now) * 1000))
+            self._play_after = self.parent.after(delay, self.start_play_loop)
     
     def on_frame_change(self, event):
         """Handle frame number change."""
@@ -783,7 +1298,7 @@ class FreePlayPanel:
             if 0 <= frame_num < max_frames:
                 self.current_frame = frame_num
                 self.frame_scale.set(frame_num)
-                self.display_preview_frame()
+                self.request_redraw()
         except ValueError:
             pass
     
@@ -795,7 +1310,7 @@ class FreePlayPanel:
             if 0 <= frame_num < max_frames:
                 self.current_frame = frame_num
                 self.frame_var.set(str(frame_num))
-                self.display_preview_frame()
+                self.request_redraw()
         except ValueError:
             pass
     
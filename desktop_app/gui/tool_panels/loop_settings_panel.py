@@ -10,8 +10,6 @@ from pathlib import Path
 from typing import Optional, Callable, Any
 import threading
 
-from gif_tools.core.loop_settings import set_gif_loop_count
-
 
 class LoopSettingsPanel:
     """Panel for GIF loop settings operations."""
@@ -10,8 +10,6 @@ from pathlib import Path
 from typing import Optional, Callable, Any, List
 import threading
 
-from gif_tools.core.merge import merge_gifs
-
 
 class MergePanel(ttk.Frame):
     """Panel for GIF merge operations."""
@@ -10,8 +10,6 @@ from pathlib import Path
 from typing import Optional, Callable, Any
 import threading
 
-from gif_tools.core.optimize import optimize_gif
-
 
 class OptimizePanel:
     """Panel for GIF optimize operations."""
@@ -11,8 +11,6 @@ from typing import Optional, Callable, Any, List
 import threading
 from PIL import Image, ImageTk
 
-from gif_tools.core.rearrange import rearrange_gif_frames
-
 
 class RearrangePanel:
     """Panel for GIF rearrange operations with frame preview and drag-and-drop."""
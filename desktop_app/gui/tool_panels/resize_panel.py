@@ -10,8 +10,6 @@ from pathlib import Path
 from typing import Optional, Callable, Any
 import threading
 
-from gif_tools.core.resize import resize_gif
-
 
 class ResizePanel(ttk.Frame):
     """Panel for GIF resize operations."""
@@ -10,8 +10,6 @@ from pathlib import Path
 from typing import Optional, Callable, Any
 import threading
 
-from gif_tools.core.reverse import reverse_gif
-
 
 class ReversePanel:
     """Panel for GIF reverse operations."""
@@ -10,8 +10,6 @@ from pathlib import Path
 from typing import Optional, Callable, Any
 import threading
 
-from gif_tools.core.rotate import rotate_gif
-
 
 class RotatePanel(ttk.Frame):
     """Panel for GIF rotate operations."""
@@ -10,8 +10,6 @@ from pathlib import Path
 from typing import Optional, Callable, Any
 import threading
 
-from gif_tools.core.speed_control import change_gif_speed
-
 
 class SpeedControlPanel:
     """Panel for GIF speed control operations."""
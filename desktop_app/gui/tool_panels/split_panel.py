@@ -12,8 +12,6 @@ import threading
 import time
 from PIL import Image, ImageTk
 
-from gif_tools.core.split import split_gif
-
 
 class SplitPanel(ttk.Frame):
     """Panel for GIF split operations with media player interface."""
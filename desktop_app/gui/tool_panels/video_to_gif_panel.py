@@ -10,8 +10,6 @@ from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 from typing import Callable, Optional
 
-from gif_tools.core import convert_video_to_gif
-
 
 class VideoToGifPanel:
     """Video to GIF conversion panel."""
@@ -10,8 +10,6 @@ from pathlib import Path
 from typing import Optional, Callable, Any
 import threading
 
-from gif_tools.core.watermark import add_text_watermark_to_gif, add_image_watermark_to_gif
-
 
 class WatermarkPanel:
     """Panel for GIF watermark operations."""
@@ -14,10 +14,11 @@ from tkinter import ttk, filedialog, messagebox
 import os
 import sys
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 import threading
 import queue
 import time
+import multiprocessing
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
@@ -35,19 +36,8 @@ from gif_tools.core import (
     # Split modes
     split_gif_into_two, extract_gif_region, remove_gif_region
 )
-from desktop_app.gui.tool_panels import (
-    RearrangePanel,
-    VideoToGifPanel,
-    FreePlayPanel,
-    ReversePanel,
-    OptimizePanel,
-    SpeedControlPanel,
-    FilterEffectsPanel,
-    ExtractFramesPanel,
-    CombineFramesPanel,
-    LoopSettingsPanel
-)
 from gif_tools.utils import validate_animated_file, get_supported_extensions
+from desktop_app.gif_encoder import encode_combined_gif
 
 
 class GifToolsApp:
@@ -71,6 +61,9 @@ class GifToolsApp:
         self.result_queue = queue.Queue()
         self.is_processing = False
         
+        # Parsed frame list CSVs, keyed by path (see _read_frame_csv)
+        self._frame_csv_cache = {}
+        
         # Start background processing thread
         self.start_background_processing()
     
@@ -315,7 +308,8 @@ class GifToolsApp:
                     self.result_queue.put({
                         'success': True,
                         'result': result,
-                        'task_id': task.get('task_id')
+                        'task_id': task.get('task_id'),
+                        'on_complete': task.get('on_complete')
                     })
                     
                 except queue.Empty:
@@ -324,7 +318,8 @@ class GifToolsApp:
                     self.result_queue.put({
                         'success': False,
                         'error': str(e),
-                        'task_id': task.get('task_id') if task else None
+                        'task_id': task.get('task_id') if task else None,
+                        'on_complete': task.get('on_complete') if task else None
                     })
                 finally:
                     self.is_processing = False
@@ -346,11 +341,23 @@ class GifToolsApp:
                     self.handle_success(result)
                 else:
                     self.handle_error(result)
+                
+                # Notify the panel that submitted the task (on the Tk thread)
+                self._notify_complete(result.get('on_complete'), result['success'])
         except queue.Empty:
             pass
-        
-        # Schedule next check
-        self.root.after(100, self.check_results)
+        finally:
+            # Schedule next check, even if handling a result failed
+            self.root.after(100, self.check_results)
+    
+    def _notify_complete(self, on_complete, success):
+        """Call a panel's on_complete callback; a failing panel must not stop result polling."""
+        if not on_complete:
+            return
+        try:
+            on_complete(success)
+        except Exception as e:
+            print(f"Completion callback error: {e}")
     
     def handle_success(self, result):
         """Handle successful processing result."""
@@ -406,49 +413,63 @@ class GifToolsApp:
         if self.is_processing:
             self.is_processing = False
             self.status_var.set("Stopping processing...")
-            # Clear the processing queue
+            # Clear the processing queue, telling panels their tasks were dropped
             while not self.processing_queue.empty():
                 try:
-                    self.processing_queue.get_nowait()
+                    task = self.processing_queue.get_nowait()
                 except queue.Empty:
                     break
+                if task:
+                    self._notify_complete(task.get('on_complete'), False)
             self.set_buttons_state(True)
             self.status_var.set("Processing stopped.")
             self.progress_var.set(0)
     
-    def process_tool(self, tool_name: str, settings: dict, input_file: Optional[str] = None):
-        """Process a tool operation."""
+    def process_tool(self, tool_name: str, settings: dict, input_file: Optional[str] = None,
+                     on_complete: Optional[Callable[[bool], None]] = None,
+                     on_progress: Optional[Callable[[int], None]] = None) -> bool:
+        """
+        Process a tool operation.
+        
+        The tool runs on the background processing thread. If given,
+        on_complete is called on the Tk thread with the task's success flag
+        once it finishes, and on_progress with its percentage as it reports
+        progress.
+        
+        Returns:
+            True if the task was queued, False if validation stopped it
+        """
         # Special handling for tools that don't need a main file loaded
         if tool_name == 'merge':
             # For merge tool, check if files are provided in settings
             if not settings.get('file_list'):
                 messagebox.showwarning("Warning", "Please add files to merge!")
-                return
+                return False
         elif tool_name == 'free_play':
             # For free_play tool, check if layers are provided in settings
             if not settings.get('gif_layers'):
                 messagebox.showwarning("Warning", "Please load GIFs to layer!")
-                return
+                return False
         elif tool_name == 'combine_frames':
             # For combine_frames tool, check if CSV file is provided in settings
             if not settings.get('csv_file'):
                 messagebox.showwarning("Warning", "Please select a CSV file!")
-                return
+                return False
         else:
             # For other tools, check if a file is loaded
             if not self.current_file and not input_file:
                 messagebox.showwarning("Warning", "No file loaded!")
-                return
+                return False
             
             input_path = input_file or self.current_file
             if not input_path:
                 messagebox.showwarning("Warning", "No input file specified!")
-                return
+                return False
         
         # Get output path
         if not self.output_dir_var.get():
             messagebox.showwarning("Warning", "Please select an output directory!")
-            return
+            return False
         
         output_dir = Path(self.output_dir_var.get())
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -484,16 +505,18 @@ class GifToolsApp:
             task = {
                 'function': self._execute_tool,
                 'args': (tool_name, None, str(output_path), settings),
-                'kwargs': {},
-                'task_id': f"{tool_name}_{int(time.time())}"
+                'kwargs': {'on_progress': on_progress},
+                'task_id': f"{tool_name}_{int(time.time())}",
+                'on_complete': on_complete
             }
         else:
             # For other tools, use the input path
             task = {
                 'function': self._execute_tool,
                 'args': (tool_name, str(input_path), str(output_path), settings),
-                'kwargs': {},
-                'task_id': f"{tool_name}_{int(time.time())}"
+                'kwargs': {'on_progress': on_progress},
+                'task_id': f"{tool_name}_{int(time.time())}",
+                'on_complete': on_complete
             }
         
         self.processing_queue.put(task)
@@ -502,13 +525,22 @@ class GifToolsApp:
         
         # Disable buttons during processing
         self.set_buttons_state(False)
+        return True
     
-    def _execute_tool(self, tool_name: str, input_path: str, output_path: str, settings: dict):
-        """Execute a specific tool."""
+    def _execute_tool(self, tool_name: str, input_path: str, output_path: str, settings: dict,
+                      on_progress: Optional[Callable[[int], None]] = None):
+        """
+        Execute a specific tool.
+        
+        Progress is shown in the status bar and, if given, also passed to
+        on_progress (on the Tk thread) for the panel that submitted the task.
+        """
         try:
             # Create progress callback
             def progress_callback(progress: int, message: str):
                 self.root.after(0, lambda: self._update_progress(progress, message))
+                if on_progress:
+                    self.root.after(0, on_progress, progress)
             
             if tool_name == 'rearrange':
                 return rearrange_gif_frames(input_path, output_path,
@@ -696,7 +728,9 @@ class GifToolsApp:
                     frame_indices=frame_indices,
                     output_format=settings.get('output_format', 'PNG'),
                     quality=settings.get('quality', 95),
-                    prefix=settings.get('prefix', 'frame')
+                    prefix=settings.get('prefix', 'frame'),
+                    max_workers=os.cpu_count(),
+                    progress_callback=progress_callback
                 )
                 
                 # Export CSV if requested
@@ -714,7 +748,15 @@ class GifToolsApp:
                 )
             elif tool_name == 'combine_frames':
                 # Combine frames from CSV
-                return self._combine_frames_from_csv(settings)
+                return self._combine_frames_from_csv(settings, progress_callback)
+            elif tool_name == 'add_text':
+                # Add text overlay to GIF (settings keys match add_text_to_gif kwargs)
+                from gif_tools.core.add_text import add_text_to_gif
+                return add_text_to_gif(
+                    input_path=input_path,
+                    output_path=output_path,
+                    **settings
+                )
             else:
                 raise ValueError(f"Unknown tool: {tool_name}")
                 
@@ -740,10 +782,11 @@ class GifToolsApp:
         elif method == 'interval':
             # Extract every nth frame
             interval = settings.get('interval', 2)
-            # We need to know the total frame count to generate indices
-            # For now, we'll extract with a reasonable range
-            # The core function can handle this
-            return None  # Let the core function handle interval extraction
+            # The panel reports the frame count it read when the GIF loaded
+            frame_count = settings.get('frame_count')
+            if frame_count:
+                return list(range(0, frame_count, interval))
+            return None  # Frame count unknown: fall back to all frames
         else:
             return None
     
@@ -848,12 +891,10 @@ class GifToolsApp:
         except Exception as e:
             print(f"DEBUG: CSV export failed: {e}")
     
-    def _combine_frames_from_csv(self, settings: dict):
+    def _combine_frames_from_csv(self, settings: dict, progress_callback: Optional[Callable] = None):
         """Combine frames from CSV file into a GIF using original timing and metadata."""
         try:
-            import csv
             from pathlib import Path
-            from PIL import Image
             
             csv_file = Path(settings.get('csv_file'))
             output_path = Path(settings.get('output_path'))
@@ -862,47 +903,10 @@ class GifToolsApp:
             if not csv_file.exists():
                 raise FileNotFoundError(f"CSV file not found: {csv_file}")
             
-            # Read CSV file and parse metadata
-            gif_metadata = {}
-            frames = []
-            durations = []
-            disposal_methods = []
-            
-            with open(csv_file, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.reader(csvfile)
-                
-                # Read GIF metadata section
-                for row in reader:
-                    if row and row[0] == '# GIF Metadata':
-                        # Read metadata rows
-                        for meta_row in reader:
-                            if not meta_row or meta_row[0] == '':
-                                break
-                            if len(meta_row) >= 2:
-                                gif_metadata[meta_row[0]] = meta_row[1]
-                        break
-                
-                # Skip to frame data section
-                for row in reader:
-                    if row and row[0] == '# Frame Data':
-                        # Skip header row
-                        next(reader)
-                        break
-                
-                # Read frame data
-                for row in reader:
-                    if not row or len(row) < 6:
-                        continue
-                    
-                    frame_path = Path(row[3])  # file_path column
-                    if frame_path.exists():
-                        frames.append(Image.open(frame_path))
-                        durations.append(int(row[4]))  # duration_ms column
-                        disposal_methods.append(int(row[5]))  # disposal_method column
-                    else:
-                        print(f"Warning: Frame file not found: {frame_path}")
+            # Per-frame records only; frame images are opened later, one at a time
+            gif_metadata, frame_paths, durations, disposal_methods = self._read_frame_csv(csv_file)
             
-            if not frames:
+            if not frame_paths:
                 raise ValueError("No valid frames found in CSV file")
             
             # Use original GIF metadata if available
@@ -910,45 +914,166 @@ class GifToolsApp:
             background = int(gif_metadata.get('background', 0))
             transparency = int(gif_metadata.get('transparency', 0))
             
-            print(f"DEBUG: Using original timing - {len(frames)} frames, durations: {durations[:5]}...")
+            print(f"DEBUG: Using original timing - {len(frame_paths)} frames, durations: {durations[:5]}...")
             print(f"DEBUG: GIF metadata - Loop: {loop_count}, Background: {background}, Transparency: {transparency}")
             
-            # Create GIF from frames with original timing
-            if len(frames) == 1:
-                # Single frame
-                frames[0].save(
-                    output_path,
-                    format='GIF',
-                    quality=quality,
-                    disposal=disposal_methods[0] if disposal_methods else 2,
-                    transparency=transparency,
-                    background=background,
-                    optimize=False
-                )
-            else:
-                # Multiple frames with original timing
-                frames[0].save(
-                    output_path,
-                    save_all=True,
-                    append_images=frames[1:],
-                    duration=durations,
-                    loop=loop_count,
-                    disposal=disposal_methods[0] if disposal_methods else 2,
-                    transparency=transparency,
-                    background=background,
-                    optimize=False
-                )
+            # Decode and encode in a separate process: PIL's GIF writer does
+            # much of its per-frame work in Python, which would otherwise
+            # compete with the Tk event loop for the GIL
+            context = multiprocessing.get_context('spawn')
+            progress_queue = context.Queue()
+            encoder = context.Process(
+                target=encode_combined_gif,
+                args=(str(output_path), frame_paths, durations, disposal_methods,
+                      loop_count, background, transparency, quality, progress_queue),
+                daemon=True
+            )
+            encoder.start()
+            
+            # Relay the encoder's messages until it exits. Liveness is checked
+            # before reading so messages flushed just before exit are not lost.
+            error = None
+            while True:
+                encoder_alive = encoder.is_alive()
+                try:
+                    kind, payload = progress_queue.get(timeout=0.1)
+                except queue.Empty:
+                    if encoder_alive:
+                        continue
+                    break
+                if kind == 'progress' and progress_callback:
+                    progress_callback(*payload)
+                elif kind == 'error':
+                    error = payload
+            encoder.join()
+            
+            if error is not None:
+                raise RuntimeError(error)
+            if encoder.exitcode != 0:
+                raise RuntimeError(f"Encoder process exited with code {encoder.exitcode}")
             
-            # Close frames to free memory
-            for frame in frames:
-                frame.close()
+            # Shrink the result further if gifsicle is installed
+            self._optimize_with_gifsicle(output_path, quality)
             
-            print(f"DEBUG: Combined {len(frames)} frames into {output_path} with original timing")
+            print(f"DEBUG: Combined {len(frame_paths)} frames into {output_path} with original timing")
             return output_path
             
         except Exception as e:
             raise Exception(f"Failed to combine frames from CSV: {e}")
     
+    def _read_frame_csv(self, csv_file: Path):
+        """
+        Parse a frame list CSV written by extract frames.
+        
+        Parsed rows are cached per file and reused while its size and
+        modification time are unchanged, so re-running a combine (e.g. to
+        try another quality) does not parse the CSV again. Frame files are
+        checked on every call, since they can be deleted or restored
+        without the CSV changing.
+        
+        Returns:
+            Tuple of (GIF metadata dict, frame paths, durations in ms,
+            disposal methods), frames whose files are missing skipped
+        """
+        stat = csv_file.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._frame_csv_cache.get(csv_file)
+        if cached is not None and cached[0] == signature:
+            gif_metadata, frame_rows = cached[1]
+        else:
+            gif_metadata, frame_rows = self._parse_frame_csv(csv_file)
+            self._frame_csv_cache[csv_file] = (signature, (gif_metadata, frame_rows))
+        
+        frame_paths = []
+        durations = []
+        disposal_methods = []
+        path_exists = os.path.exists
+        for frame_path, duration, disposal_method in frame_rows:
+            if path_exists(frame_path):
+                frame_paths.append(frame_path)
+                durations.append(duration)
+                disposal_methods.append(disposal_method)
+            else:
+                print(f"Warning: Frame file not found: {frame_path}")
+        
+        return gif_metadata, tuple(frame_paths), tuple(durations), tuple(disposal_methods)
+    
+    def _parse_frame_csv(self, csv_file: Path):
+        """
+        Read the metadata and frame rows of a frame list CSV.
+        
+        Returns:
+            Tuple of (GIF metadata dict, tuple of (frame path, duration in
+            ms, disposal method) rows)
+        """
+        import csv
+        
+        gif_metadata = {}
+        frame_rows = []
+        
+        with open(csv_file, 'r', newline='', encoding='utf-8') as csvfile:
+            reader = csv.reader(csvfile)
+            
+            # Read GIF metadata section
+            for row in reader:
+                if row and row[0] == '# GIF Metadata':
+                    # Read metadata rows
+                    for meta_row in reader:
+                        if not meta_row or meta_row[0] == '':
+                            break
+                        if len(meta_row) >= 2:
+                            gif_metadata[meta_row[0]] = meta_row[1]
+                    break
+            
+            # Skip to frame data section
+            for row in reader:
+                if row and row[0] == '# Frame Data':
+                    # Skip header row
+                    next(reader)
+                    break
+            
+            # Read frame data. Paths stay plain strings: building a Path
+            # object per row costs more than the csv tokenizing itself.
+            for row in reader:
+                if not row or len(row) < 6:
+                    continue
+                
+                frame_rows.append((
+                    row[3],  # file_path column
+                    int(row[4]),  # duration_ms column
+                    int(row[5]),  # disposal_method column
+                ))
+        
+        return gif_metadata, tuple(frame_rows)
+    
+    def _optimize_with_gifsicle(self, gif_path: Path, quality: int):
+        """
+        Optimize a GIF in place with gifsicle, if it is on the PATH.
+        
+        Quality 100 runs a lossless -O3 pass; lower qualities also allow
+        gifsicle's lossy compression, from --lossy=2 at 99 up to 198 at 1.
+        This step is optional: if gifsicle is missing or fails, the GIF
+        written by PIL is kept unchanged.
+        """
+        import shutil
+        import subprocess
+        
+        gifsicle = shutil.which('gifsicle')
+        if not gifsicle:
+            return
+        
+        command = [gifsicle, '--batch', '-O3']
+        if quality < 100:
+            command.append(f'--lossy={200 - 2 * quality}')
+        command.append(str(gif_path))
+        
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, timeout=300)
+            if result.returncode != 0:
+                print(f"DEBUG: gifsicle failed, keeping unoptimized GIF: {result.stderr.strip()}")
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"DEBUG: gifsicle failed, keeping unoptimized GIF: {e}")
+    
     def _update_progress(self, progress: int, message: str):
         """Update progress bar and status message."""
         self.progress_var.set(progress)
@@ -1009,6 +1134,8 @@ class GifToolsApp:
     # Tool dialog methods
     def open_video_to_gif_dialog(self):
         """Open video to GIF conversion dialog."""
+        from desktop_app.gui.tool_panels import VideoToGifPanel
+        
         self._open_tool_dialog("Video to GIF Converter", VideoToGifPanel)
     
     def open_resize_dialog(self):
@@ -1112,6 +1239,8 @@ class GifToolsApp:
     
     def open_reverse_dialog(self):
         """Open reverse dialog."""
+        from desktop_app.gui.tool_panels import ReversePanel
+        
         if not self.current_file:
             messagebox.showwarning("No File", "Please select a GIF file first.")
             return
@@ -1141,6 +1270,8 @@ class GifToolsApp:
     
     def open_optimize_dialog(self):
         """Open optimize dialog."""
+        from desktop_app.gui.tool_panels import OptimizePanel
+        
         if not self.current_file:
             messagebox.showwarning("No File", "Please select a GIF file first.")
             return
@@ -1170,6 +1301,8 @@ class GifToolsApp:
     
     def open_speed_control_dialog(self):
         """Open speed control dialog."""
+        from desktop_app.gui.tool_panels import SpeedControlPanel
+        
         if not self.current_file:
             messagebox.showwarning("No File", "Please select a GIF file first.")
             return
@@ -1226,6 +1359,8 @@ class GifToolsApp:
     
     def open_free_play_dialog(self):
         """Open free play dialog for layering GIFs."""
+        from desktop_app.gui.tool_panels import FreePlayPanel
+        
         dialog = tk.Toplevel(self.root)
         dialog.title("Free Play - Layer GIFs")
         dialog.geometry("1200x800")
@@ -1242,11 +1377,15 @@ class GifToolsApp:
     
     def open_rearrange_dialog(self):
         """Open rearrange dialog."""
+        from desktop_app.gui.tool_panels import RearrangePanel
+        
         self._open_tool_dialog("Rearrange GIF Frames", RearrangePanel)
     
     
     def open_filter_dialog(self):
         """Open filter effects dialog."""
+        from desktop_app.gui.tool_panels import FilterEffectsPanel
+        
         if not self.current_file:
             messagebox.showwarning("No File", "Please select a GIF file first.")
             return
@@ -1276,6 +1415,8 @@ class GifToolsApp:
     
     def open_extract_frames_dialog(self):
         """Open extract frames dialog."""
+        from desktop_app.gui.tool_panels import ExtractFramesPanel
+        
         if not self.current_file:
             messagebox.showwarning("No File", "Please select a GIF file first.")
             return
@@ -1296,6 +1437,8 @@ class GifToolsApp:
     
     def open_combine_frames_dialog(self):
         """Open combine frames dialog."""
+        from desktop_app.gui.tool_panels import CombineFramesPanel
+        
         # Create dialog window
         dialog = tk.Toplevel(self.root)
         dialog.title("Combine Frames from CSV")
@@ -1309,6 +1452,8 @@ class GifToolsApp:
     
     def open_loop_settings_dialog(self):
         """Open loop settings dialog."""
+        from desktop_app.gui.tool_panels import LoopSettingsPanel
+        
         if not self.current_file:
             messagebox.showwarning("No File", "Please select a GIF file first.")
             return
@@ -5,8 +5,11 @@ This module provides functionality to extract specific frames from GIFs
 and save them as static images in various formats.
 """
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from PIL import Image
 
@@ -20,6 +23,47 @@ from ..utils import (
 )
 
 
+# Below this many frames per worker, process start-up outweighs the
+# parallel encode and extraction stays in-process. A spawned worker
+# re-imports gif_tools.core (moviepy included), which costs on the order
+# of a second, while an optimized frame save takes tens of milliseconds.
+MIN_FRAMES_PER_WORKER = 64
+
+
+def _extract_frame_chunk(input_path: str, frame_indices: List[int], output_dir: str,
+                         output_format: str, quality: int, prefix: str) -> List[Path]:
+    """
+    Save the given frames of a GIF as static images.
+    
+    Opens the GIF once for the whole chunk. Module-level so it can run in
+    a worker process.
+    
+    Returns:
+        List of paths to extracted frame files, in frame_indices order
+    """
+    image_processor = get_image_processor()
+    output_dir = Path(output_dir)
+    extracted_paths = []
+    
+    with Image.open(input_path) as gif:
+        for frame_idx in frame_indices:
+            gif.seek(frame_idx)
+            frame = gif.copy()
+            
+            # Generate output filename
+            filename = f"{prefix}_{frame_idx:04d}.{output_format.lower()}"
+            output_path = output_dir / filename
+            
+            # Save frame
+            image_processor.save_image(
+                frame, output_path, quality=quality, optimize=True
+            )
+            
+            extracted_paths.append(output_path)
+    
+    return extracted_paths
+
+
 class GifFrameExtractor:
     """GIF frame extraction utility class."""
     
@@ -33,10 +77,17 @@ class GifFrameExtractor:
                       frame_indices: Optional[List[int]] = None,
                       output_format: str = 'PNG',
                       quality: int = 95,
-                      prefix: str = 'frame') -> List[Path]:
+                      prefix: str = 'frame',
+                      max_workers: int = 1,
+                      progress_callback: Optional[Callable[[int, str], None]] = None) -> List[Path]:
         """
         Extract specific frames from GIF and save as static images.
         
+        Frames are encoded independently, so callers can opt in to splitting
+        larger extractions into chunks saved by a pool of worker processes.
+        Worker processes are spawned, so scripts passing max_workers > 1
+        need an ``if __name__ == '__main__':`` guard.
+        
         Args:
             input_path: Path to input GIF file
             output_dir: Directory to save extracted frames
@@ -44,6 +95,10 @@ class GifFrameExtractor:
             output_format: Output image format (PNG, JPEG, BMP, etc.)
             quality: Output quality for lossy formats (1-100)
             prefix: Prefix for output filenames
+            max_workers: Worker processes to use (1, the default, extracts
+                in-process; None for one per CPU)
+            progress_callback: Optional callback(progress, message), called
+                as chunks complete
             
         Returns:
             List of paths to extracted frame files
@@ -83,28 +138,59 @@ class GifFrameExtractor:
                     if not all(0 <= idx < frame_count for idx in frame_indices):
                         raise ValidationError("All frame indices must be within valid range")
                 
-                # Extract frames
-                extracted_paths = []
-                for i, frame_idx in enumerate(frame_indices):
-                    gif.seek(frame_idx)
-                    frame = gif.copy()
-                    
-                    # Generate output filename
-                    filename = f"{prefix}_{frame_idx:04d}.{output_format.lower()}"
-                    output_path = output_dir / filename
-                    
-                    # Save frame
-                    self.image_processor.save_image(
-                        frame, output_path, quality=quality, optimize=True
-                    )
-                    
-                    extracted_paths.append(output_path)
-                
-                return extracted_paths
+            # Extract frames
+            return self._extract_frame_chunks(
+                input_path, list(frame_indices), output_dir, output_format,
+                quality, prefix, max_workers, progress_callback
+            )
                 
         except Exception as e:
             raise ValidationError(f"GIF frame extraction failed: {e}")
     
+    def _extract_frame_chunks(self, input_path: Path, frame_indices: List[int],
+                              output_dir: Path, output_format: str, quality: int,
+                              prefix: str, max_workers: Optional[int],
+                              progress_callback: Optional[Callable[[int, str], None]]) -> List[Path]:
+        """
+        Extract frames in contiguous chunks, in parallel when worthwhile.
+        
+        Returns:
+            List of paths to extracted frame files, in frame_indices order
+        """
+        workers = max_workers or os.cpu_count() or 1
+        workers = min(workers, len(frame_indices) // MIN_FRAMES_PER_WORKER)
+        
+        if workers <= 1:
+            extracted_paths = _extract_frame_chunk(
+                str(input_path), frame_indices, str(output_dir), output_format, quality, prefix
+            )
+            if progress_callback:
+                progress_callback(100, f"Extracted {len(extracted_paths)} frames")
+            return extracted_paths
+        
+        # GIF frames can only be decoded in order, so each worker decodes
+        # from the start of the file up to the end of its chunk; only the
+        # encoding and saving run in parallel
+        chunk_size = -(-len(frame_indices) // workers)
+        chunks = [frame_indices[i:i + chunk_size] for i in range(0, len(frame_indices), chunk_size)]
+        results = [None] * len(chunks)
+        
+        # Spawn rather than fork: callers may be running GUI threads
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=len(chunks), mp_context=context) as executor:
+            futures = {
+                executor.submit(_extract_frame_chunk, str(input_path), chunk, str(output_dir),
+                                output_format, quality, prefix): i
+                for i, chunk in enumerate(chunks)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+                if progress_callback:
+                    progress_callback(done * 100 // len(chunks),
+                                      f"Extracted {done}/{len(chunks)} chunks")
+        
+        return [path for chunk_paths in results for path in chunk_paths]
+    
     def extract_frame_range(self,
                            input_path: Union[str, Path],
                            output_dir: Union[str, Path],
@@ -429,15 +429,9 @@ class ImageProcessor:
         stroke_alpha = int(255 * stroke_opacity)
         stroke_color_with_alpha = stroke_color[:3] + (stroke_alpha,)
         
-        # Draw text stroke if specified
-        if stroke_width > 0:
-            for dx in range(-stroke_width, stroke_width + 1):
-                for dy in range(-stroke_width, stroke_width + 1):
-                    if dx != 0 or dy != 0:
-                        draw.text((x + dx, y + dy), text, font=font, fill=stroke_color_with_alpha)
-        
-        # Draw text
-        draw.text((x, y), text, font=font, fill=text_color_with_alpha)
+        # Draw text (PIL strokes the outline itself when stroke_width > 0)
+        draw.text((x, y), text, font=font, fill=text_color_with_alpha,
+                  stroke_width=stroke_width, stroke_fill=stroke_color_with_alpha)
         
         return result
     
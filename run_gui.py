@@ -12,8 +12,9 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# Import and run the main application
-from desktop_app.main import main
-
 if __name__ == "__main__":
+    # Import and run the main application. The import stays under the
+    # guard so worker processes, which re-run this script on start-up,
+    # do not load the GUI.
+    from desktop_app.main import main
     main()